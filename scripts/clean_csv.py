@@ -13,8 +13,11 @@ from __future__ import annotations
 
 import argparse
 import csv
+import os
 import sys
+from contextlib import ExitStack
 from pathlib import Path
+from typing import IO, Union
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,20 +27,21 @@ from src.core.file_io import ensure_parent_dir  # noqa: E402
 DEFAULT_INPUT = Path("data/raw/sharepoint/Hassan Rahman_2025-8-16-20-24-4_1.csv")
 DEFAULT_OUTPUT = Path("data/processed/sharepoint_permissions_clean.csv")
 
+PathOrBuffer = Union[str, Path, IO[str]]
 
-def clean_csv(in_path: Path, out_path: Path) -> dict:
+
+def clean_csv(in_path: PathOrBuffer, out_path: PathOrBuffer) -> dict:
     """
     Clean CSV file in a single pass for better performance.
 
+    Either argument may be a path or an already-open text stream (e.g. ``io.StringIO``);
+    streams are read/written as-is and left open for the caller.
+
     Optimizations:
     - Single-pass processing (no intermediate list storage)
     - Streaming I/O for memory efficiency
     - In-place cell stripping to reduce allocations
     """
-    in_path = Path(in_path)
-    out_path = Path(out_path)
-    ensure_parent_dir(out_path)
-
     stats = {
         "input_lines": 0,
         "output_rows": 0,
@@ -48,9 +52,18 @@ def clean_csv(in_path: Path, out_path: Path) -> dict:
     }
 
     # Single-pass processing: filter and write simultaneously
-    with in_path.open("r", encoding="utf-8-sig", errors="replace") as input_file, out_path.open(
-        "w", encoding="utf-8", newline=""
-    ) as output_file:
+    with ExitStack() as stack:
+        input_file: IO[str]
+        if isinstance(in_path, (str, os.PathLike)):
+            input_file = stack.enter_context(Path(in_path).open("r", encoding="utf-8-sig", errors="replace"))
+        else:
+            input_file = in_path
+        output_file: IO[str]
+        if isinstance(out_path, (str, os.PathLike)):
+            out_path = ensure_parent_dir(Path(out_path))
+            output_file = stack.enter_context(out_path.open("w", encoding="utf-8", newline=""))
+        else:
+            output_file = out_path
 
         writer = csv.writer(output_file, lineterminator="\n")
         header = None
@@ -11,12 +11,15 @@ Reference: #app.py - Flask application initialization and configuration
 """
 
 import os
-from pathlib import Path
+from typing import Set
 
 from flask import Flask, jsonify
 
 from src.api.auth_routes import init_auth_routes
 
+# SQLite data directories already created by this process (skips repeat mkdir syscalls)
+_ENSURED_DIRS: Set[str] = set()
+
 
 def create_app(config: dict = None) -> Flask:
     """
@@ -32,6 +35,7 @@ def create_app(config: dict = None) -> Flask:
         DATABASE_URL: Database connection string (default: sqlite:///data/users.db)
         SECRET_KEY: Flask secret key for session management
         DEBUG: Debug mode (default: False)
+        BCRYPT_ROUNDS: Bcrypt cost factor for password hashing (default: 12)
 
     Reference: #create_app - Flask application factory pattern
     """
@@ -42,6 +46,7 @@ def create_app(config: dict = None) -> Flask:
         "DATABASE_URL": os.getenv("DATABASE_URL", "sqlite:///data/users.db"),
         "SECRET_KEY": os.getenv("SECRET_KEY", "dev-secret-key-change-in-production"),
         "DEBUG": os.getenv("FLASK_DEBUG", "False").lower() == "true",
+        "BCRYPT_ROUNDS": int(os.getenv("BCRYPT_ROUNDS", "12")),
     }
 
     # Merge with provided config
@@ -53,7 +58,10 @@ def create_app(config: dict = None) -> Flask:
     # Ensure data directory exists for SQLite
     if app.config["DATABASE_URL"].startswith("sqlite:///"):
         db_path = app.config["DATABASE_URL"].replace("sqlite:///", "")
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        parent = os.path.dirname(db_path)
+        if parent and parent not in _ENSURED_DIRS:
+            os.makedirs(parent, exist_ok=True)
+            _ENSURED_DIRS.add(parent)
 
     # Initialize authentication routes with database
     init_auth_routes(app, app.config["DATABASE_URL"])
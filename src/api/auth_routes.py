@@ -8,18 +8,29 @@ Reference: #auth_routes.py - REST API endpoints for authentication
 Integration with: #models.py (User model), #validators.py (input validation)
 """
 
-from flask import Blueprint, Flask, jsonify, request
+import json
+from typing import Any, Optional
+
+from flask import Blueprint, Flask, Response, current_app, jsonify, request
+from sqlalchemy import exists, select
 from sqlalchemy.exc import IntegrityError
 
-from src.api.models import DatabaseManager, User
+from src.api.bloom_filter import BloomFilter
+from src.api.login_cache import FailedLoginCache
+from src.api.models import DEFAULT_BCRYPT_ROUNDS, DatabaseManager, User, verify_dummy_password
 from src.api.validators import validate_registration_data
 
+# Optional fast JSON encoder for response bodies (falls back to Flask's jsonify)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Create Blueprint for authentication routes
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
-# Initialize database manager (will be configured by app)
-db_manager = None
-
 
 def init_auth_routes(app: Flask, database_url: str = "sqlite:///data/users.db"):
     """
@@ -31,12 +42,107 @@ def init_auth_routes(app: Flask, database_url: str = "sqlite:///data/users.db"):
 
     Reference: #init_auth_routes - Blueprint initialization with database
     """
-    global db_manager
-    db_manager = DatabaseManager(database_url)
-    db_manager.create_tables()
+    # Per-app database manager, so several apps in one process keep separate engines
+    manager = DatabaseManager(database_url)
+    manager.create_tables()
+    app.extensions["db_manager"] = manager
+
+    # Usernames/emails already taken. A miss is definitive, so most registrations skip the
+    # duplicate-check queries; the unique constraints still catch rows inserted elsewhere.
+    registered_identities = BloomFilter()
+    with manager.get_session() as session:
+        for username, email in session.execute(select(User.username, User.email)):
+            registered_identities.add(username)
+            registered_identities.add(email)
+    app.extensions["registered_identities"] = registered_identities
+
+    # Recently failed credentials, so replayed guesses skip bcrypt entirely
+    app.extensions["failed_login_cache"] = FailedLoginCache()
+
+    @app.teardown_appcontext
+    def remove_db_session(exception=None):
+        """Return the request's scoped session connection to the pool."""
+        manager.Session.remove()
+
     app.register_blueprint(auth_bp)
 
 
+def _json_response(payload: dict, status: int):
+    """
+    Build a JSON response, encoding with orjson when it is installed.
+
+    Args:
+        payload: JSON-serializable response body
+        status: HTTP status code
+
+    Returns:
+        Flask view return value (response, status)
+
+    Reference: #_json_response - Fast JSON serialization for hot endpoints
+    """
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(payload), mimetype="application/json"), status
+    return jsonify(payload), status
+
+
+def _encode_error(message: str) -> bytes:
+    """Encode a static ``{"success": False, "message": ...}`` body once at import time."""
+    payload = {"success": False, "message": message}
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+# Pre-encoded bodies for errors whose text never changes. Only the bytes are shared:
+# Response objects are mutable (headers, cookies), so a fresh one is built per request.
+_ERR_BODY_REQUIRED = _encode_error("Request body is required")
+_ERR_CREDENTIALS_REQUIRED = _encode_error("Username and password are required")
+_ERR_USERNAME_EXISTS = _encode_error("Username already exists")
+_ERR_EMAIL_EXISTS = _encode_error("Email already exists")
+_ERR_USER_EXISTS = _encode_error("Username or email already exists")
+_ERR_INVALID_CREDENTIALS = _encode_error("Invalid credentials")
+_ERR_ACCOUNT_DISABLED = _encode_error("Account is disabled")
+
+
+def _error_response(body: bytes, status: int):
+    """
+    Build an error response from a pre-encoded static body.
+
+    Args:
+        body: One of the module-level ``_ERR_*`` encoded bodies
+        status: HTTP status code
+
+    Returns:
+        Flask view return value (response, status)
+
+    Reference: #_error_response - Skip JSON encoding on static error paths
+    """
+    return Response(body, mimetype="application/json"), status
+
+
+def _duplicate_identity_error(session, username: str, email: str) -> Optional[bytes]:
+    """
+    Check whether a username or email is already registered.
+
+    Each EXISTS probe hits one unique index and returns a boolean.
+
+    Args:
+        session: Active database session
+        username: Requested username
+        email: Requested email address
+
+    Returns:
+        Encoded 409 error body for the first taken field, or None if neither is taken
+
+    Reference: #_duplicate_identity_error - Specific duplicate-registration messages
+    """
+    if session.scalar(select(exists().where(User.username == username))):
+        return _ERR_USERNAME_EXISTS
+    if session.scalar(select(exists().where(User.email == email))):
+        return _ERR_EMAIL_EXISTS
+    return None
+
+
 @auth_bp.route("/register", methods=["POST"])
 def register_user():
     """
@@ -81,7 +187,7 @@ def register_user():
 
     Security Features:
         - Input validation (email format, password strength)
-        - Bcrypt password hashing with salt (cost factor 12)
+        - Bcrypt password hashing with salt (cost factor from BCRYPT_ROUNDS, default 12)
         - Duplicate user detection
         - Never returns password in response
         - SQL injection protection via SQLAlchemy ORM
@@ -98,7 +204,7 @@ def register_user():
         data = request.get_json()
 
         if not data:
-            return jsonify({"success": False, "message": "Request body is required"}), 400
+            return _error_response(_ERR_BODY_REQUIRED, 400)
 
         # Extract fields
         username = data.get("username", "").strip()
@@ -115,53 +221,55 @@ def register_user():
                 400,
             )
 
-        # Create database session
-        session = db_manager.get_session()
+        # Request-scoped session (removed in the app's teardown_appcontext handler)
+        session = current_app.extensions["db_manager"].Session()
 
         try:
-            # Check if username or email already exists
-            existing_user = (
-                session.query(User).filter((User.username == username) | (User.email == email)).first()
-            )
-
-            if existing_user:
-                if existing_user.username == username:
-                    return jsonify({"success": False, "message": "Username already exists"}), 409
-                else:
-                    return jsonify({"success": False, "message": "Email already exists"}), 409
+            # Check if username or email already exists. The Bloom filter rules out never-seen values
+            # without a query; otherwise probe the unique indexes.
+            registered_identities = current_app.extensions["registered_identities"]
+            if username in registered_identities or email in registered_identities:
+                duplicate_error = _duplicate_identity_error(session, username, email)
+                if duplicate_error is not None:
+                    return _error_response(duplicate_error, 409)
 
             # Create new user (Integration with #User model)
             new_user = User(username=username, email=email, full_name=full_name)
 
             # Hash password using bcrypt (Integration with #set_password method)
-            new_user.set_password(password)
+            new_user.set_password(password, rounds=current_app.config.get("BCRYPT_ROUNDS", DEFAULT_BCRYPT_ROUNDS))
 
             # Save to database
             session.add(new_user)
+
+            # Flush the INSERT to get the generated id (Python-side defaults are already set) and
+            # serialize before commit expires the instance, avoiding a refresh SELECT round trip
+            session.flush()
+            user_payload = new_user.to_dict()
             session.commit()
 
-            # Refresh to get auto-generated fields
-            session.refresh(new_user)
+            registered_identities.add(username)
+            registered_identities.add(email)
+
+            # Earlier failed logins against this not-yet-existing account must not block it
+            current_app.extensions["failed_login_cache"].discard_identifiers((username, email))
 
             # Return success response (Integration with #to_dict method - excludes password)
-            return (
-                jsonify(
-                    {"success": True, "message": "User registered successfully", "user": new_user.to_dict()}
-                ),
-                201,
+            return _json_response(
+                {"success": True, "message": "User registered successfully", "user": user_payload}, 201
             )
 
-        except IntegrityError as e:
+        except IntegrityError:
+            # Another worker inserted the same identity after our Bloom filter check (a filter
+            # miss there); probe again so the client still learns which field is taken
             session.rollback()
-            return jsonify({"success": False, "message": "Username or email already exists"}), 409
+            duplicate_error = _duplicate_identity_error(session, username, email)
+            return _error_response(duplicate_error or _ERR_USER_EXISTS, 409)
 
         except Exception as e:
             session.rollback()
             return jsonify({"success": False, "message": f"Database error: {str(e)}"}), 500
 
-        finally:
-            session.close()
-
     except Exception as e:
         return jsonify({"success": False, "message": f"Server error: {str(e)}"}), 500
 
@@ -203,9 +311,11 @@ def login_user():
         - Constant-time password comparison
         - No information leakage about username existence
         - Account active status check
+        - Repeated failed credentials are rejected from a short-lived cache (no bcrypt)
 
     Integration:
         - Uses #check_password method from User model (bcrypt verification)
+        - Uses #FailedLoginCache from login_cache.py for replayed bad credentials
         - Uses #to_dict method to safely serialize user data
 
     Reference: #loginUser endpoint - Secure login with bcrypt verification
@@ -215,39 +325,48 @@ def login_user():
         data = request.get_json()
 
         if not data:
-            return jsonify({"success": False, "message": "Request body is required"}), 400
+            return _error_response(_ERR_BODY_REQUIRED, 400)
 
         # Extract credentials
         username = data.get("username", "").strip()
         password = data.get("password", "")
 
         if not username or not password:
-            return jsonify({"success": False, "message": "Username and password are required"}), 400
-
-        # Create database session
-        session = db_manager.get_session()
-
-        try:
-            # Find user by username or email
-            user = session.query(User).filter((User.username == username) | (User.email == username)).first()
-
-            # Check if user exists and password is correct (Integration with #check_password)
-            if not user or not user.check_password(password):
-                # Generic error message to prevent username enumeration
-                return jsonify({"success": False, "message": "Invalid credentials"}), 401
-
-            # Check if account is active
-            if not user.is_active:
-                return jsonify({"success": False, "message": "Account is disabled"}), 401
-
-            # Return success response (Integration with #to_dict)
-            return (
-                jsonify({"success": True, "message": "Login successful", "user": user.to_dict()}),
-                200,
-            )
-
-        finally:
-            session.close()
+            return _error_response(_ERR_CREDENTIALS_REQUIRED, 400)
+
+        # Replayed bad credentials are rejected without touching the database or bcrypt
+        failed_logins = current_app.extensions["failed_login_cache"]
+        if failed_logins.contains(username, password):
+            return _error_response(_ERR_INVALID_CREDENTIALS, 401)
+
+        # Request-scoped session (removed in the app's teardown_appcontext handler)
+        session = current_app.extensions["db_manager"].Session()
+
+        # Find user by username or email. Usernames cannot contain "@" (see #validate_username),
+        # so the identifier maps to exactly one unique-index lookup.
+        lookup_column: Any = User.email if "@" in username else User.username
+        user = session.scalar(select(User).where(lookup_column == username))
+
+        # Check if user exists and password is correct (Integration with #check_password).
+        # Unknown users still pay for one bcrypt check so timing doesn't reveal which accounts exist.
+        rounds = current_app.config.get("BCRYPT_ROUNDS", DEFAULT_BCRYPT_ROUNDS)
+        if user is None:
+            password_valid = verify_dummy_password(rounds)
+        else:
+            password_valid = user.check_password(password, rounds)
+
+        if not password_valid:
+            # Cache failures for unknown users too, so cached responses don't reveal existence
+            failed_logins.add(username, password)
+            # Generic error message to prevent username enumeration
+            return _error_response(_ERR_INVALID_CREDENTIALS, 401)
+
+        # Check if account is active
+        if not user.is_active:
+            return _error_response(_ERR_ACCOUNT_DISABLED, 401)
+
+        # Return success response (Integration with #to_dict)
+        return _json_response({"success": True, "message": "Login successful", "user": user.to_dict()}, 200)
 
     except Exception as e:
         return jsonify({"success": False, "message": f"Server error: {str(e)}"}), 500
@@ -0,0 +1,89 @@
+"""
+Bloom Filter - Probabilistic membership test for registration lookups
+
+A compact, stdlib-only Bloom filter used to skip database duplicate checks
+for usernames and emails that have definitely never been registered.
+
+Reference: #bloom_filter.py - Fast negative lookups for the register endpoint
+Integration with: #auth_routes.py (init_auth_routes, register_user)
+"""
+
+import hashlib
+import math
+import threading
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over a ``bytearray`` bit set.
+
+    ``x in bloom`` returning False means ``x`` was never added; True means it
+    probably was (false positives occur at roughly ``error_rate`` once
+    ``capacity`` items have been added). Bit positions are derived from one
+    BLAKE2b digest per item using double hashing.
+
+    Reference: #BloomFilter - Skip EXISTS queries for new usernames/emails
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        """
+        Initialize an empty Bloom filter sized for the expected load.
+
+        Args:
+            capacity: Expected number of items to be added
+            error_rate: Target false-positive rate at ``capacity`` items
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+
+        Args:
+            item: String to record
+        """
+        positions = list(self._positions(item))
+        bits = self._bits
+        # bytearray |= is a read-modify-write; lock so concurrent adds cannot drop bits
+        with self._lock:
+            for pos in positions:
+                bits[pos >> 3] |= 1 << (pos & 7)
+            self._count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Add several items to the filter.
+
+        Args:
+            items: Strings to record
+        """
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        """Number of items added (duplicates counted each time)."""
+        return self._count
@@ -0,0 +1,103 @@
+"""
+Failed Login Cache - Short-circuit repeated bad credentials
+
+Keeps a short-lived, bounded record of (identifier, password) pairs that
+recently failed verification so replayed guesses can be rejected without
+running bcrypt again.
+
+Reference: #login_cache.py - Negative-lookup cache for the login endpoint
+Integration with: #auth_routes.py (login_user, register_user)
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Tuple
+
+
+class FailedLoginCache:
+    """
+    Bounded TTL cache of recently failed login attempts.
+
+    Passwords are never stored: entries are keyed on a keyed BLAKE2b digest
+    using a per-process random key, so cached digests are useless outside
+    this process. Entries expire after ``ttl`` seconds and the oldest entries
+    are evicted once ``maxsize`` is reached.
+
+    Reference: #FailedLoginCache - Skip bcrypt for replayed bad credentials
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60.0):
+        """
+        Initialize failed login cache.
+
+        Args:
+            maxsize: Maximum number of failed attempts remembered
+            ttl: Seconds a failed attempt is remembered for
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._digest_key = os.urandom(16)
+        self._entries: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, identifier: str, password: str) -> Tuple[str, str]:
+        digest = hashlib.blake2b(password.encode("utf-8"), digest_size=16, key=self._digest_key).hexdigest()
+        return identifier, digest
+
+    def contains(self, identifier: str, password: str) -> bool:
+        """
+        Check whether this identifier/password pair failed recently.
+
+        Args:
+            identifier: Username or email used to log in
+            password: Plain text password attempted
+
+        Returns:
+            True if the same pair failed within the TTL window
+        """
+        key = self._key(identifier, password)
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False
+            return True
+
+    def add(self, identifier: str, password: str) -> None:
+        """
+        Record a failed identifier/password pair.
+
+        Args:
+            identifier: Username or email used to log in
+            password: Plain text password attempted
+        """
+        key = self._key(identifier, password)
+        with self._lock:
+            self._entries[key] = time.monotonic() + self.ttl
+            # Constant TTL keeps insertion order == expiry order, so the front is always oldest
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_identifiers(self, identifiers: Iterable[str]) -> None:
+        """
+        Forget all failed attempts for the given identifiers.
+
+        Called when an account is created so earlier failures against a
+        not-yet-existing username or email cannot block the new user.
+
+        Args:
+            identifiers: Usernames and/or emails to forget
+        """
+        identifiers = set(identifiers)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in identifiers]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -7,15 +7,70 @@ Passwords are hashed using bcrypt before storage.
 Reference: #models.py - User data model with secure password handling
 """
 
+import hashlib
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, cast
 
 import bcrypt
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, create_engine, event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 Base = declarative_base()
 
+# Default bcrypt cost factor; override per app via the BCRYPT_ROUNDS config key
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+@lru_cache(maxsize=None)
+def dummy_password_hash(rounds: int = DEFAULT_BCRYPT_ROUNDS) -> bytes:
+    """
+    Return a throwaway bcrypt hash with the given cost factor (computed once per cost).
+
+    Reference: #dummy_password_hash - Timing-equalization hash for failed lookups
+    """
+    return bcrypt.hashpw(b"not-a-real-password", bcrypt.gensalt(rounds=rounds))
+
+
+def verify_dummy_password(rounds: int = DEFAULT_BCRYPT_ROUNDS) -> bool:
+    """
+    Spend one bcrypt verification's worth of time and always fail.
+
+    Used when there is no usable stored hash (unknown user, malformed row) so the
+    response time does not reveal which case occurred.
+
+    Args:
+        rounds: Bcrypt cost factor to match (default: 12)
+
+    Returns:
+        Always False
+
+    Reference: #verify_dummy_password - Constant-cost rejection path
+    """
+    bcrypt.checkpw(b"x", dummy_password_hash(rounds))
+    return False
+
+
+@lru_cache(maxsize=None)
+def _schema_version() -> int:
+    """
+    Fingerprint the declared schema as a positive 31-bit integer for SQLite's user_version.
+
+    Reference: #_schema_version - Warm-start marker for create_tables
+    """
+    dialect = sqlite.dialect()
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)))
+        statements.extend(str(CreateIndex(index).compile(dialect=dialect)) for index in sorted(table.indexes, key=str))
+    schema = "\n".join(statements)
+    digest = hashlib.blake2b(schema.encode("utf-8"), digest_size=4).digest()
+    return (int.from_bytes(digest, "big") & 0x7FFFFFFF) or 1
+
 
 # Helper function for datetime defaults
 def _utc_now():
@@ -23,6 +78,49 @@ def _utc_now():
     return datetime.now(timezone.utc)
 
 
+def _isoformat_utc(value: Optional[datetime]) -> Optional[str]:
+    """
+    Serialize a timestamp as naive UTC ISO 8601.
+
+    In-memory defaults are tz-aware while SQLite hands back naive UTC, so both
+    are normalized to the naive form before formatting.
+
+    Reference: #_isoformat_utc - One timestamp format for every endpoint
+    """
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _is_memory_sqlite(database_url) -> bool:
+    """Whether a SQLAlchemy URL names an in-memory SQLite database (plain or shared-cache)."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    return not url.database or url.database == ":memory:" or url.query.get("mode") == "memory"
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune each new SQLite connection for the auth workload.
+
+    - WAL journal: one fsync per commit instead of two, readers don't block the writer
+    - synchronous=NORMAL: durable across app crashes (WAL), fsync only at checkpoints
+    - temp_store=MEMORY: temporary tables/indices stay in RAM
+    - mmap_size=256MB: reads become memory accesses instead of pread() syscalls
+
+    Reference: #_set_sqlite_pragmas - SQLite connection tuning
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 class User(Base):
     """
     User model for authentication system.
@@ -54,37 +152,45 @@ class User(Base):
     created_at = Column(DateTime, default=_utc_now, nullable=False)
     updated_at = Column(DateTime, default=_utc_now, onupdate=_utc_now, nullable=False)
 
-    def set_password(self, password: str) -> None:
+    def set_password(self, password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> None:
         """
         Hash and set user password using bcrypt.
 
         Args:
             password: Plain text password to hash
+            rounds: Bcrypt cost factor (4-31, default: 12). Each increment doubles hashing time.
 
         Security:
             - Uses bcrypt with automatic salt generation
-            - Cost factor of 12 (balanced security/performance)
+            - Cost factor of 12 by default (balanced security/performance)
             - Never stores plain text passwords
 
         Reference: #set_password - Bcrypt password hashing implementation
         """
-        # Generate salt and hash password with cost factor 12
-        salt = bcrypt.gensalt(rounds=12)
+        # Generate salt and hash password with the configured cost factor
+        salt = bcrypt.gensalt(rounds=rounds)
         self.password_hash = bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
-    def check_password(self, password: str) -> bool:
+    def check_password(self, password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> bool:
         """
         Verify password against stored hash.
 
         Args:
             password: Plain text password to verify
+            rounds: Bcrypt cost factor for the dummy check run on a malformed stored hash;
+                pass the app's BCRYPT_ROUNDS so every rejection path costs the same
 
         Returns:
             True if password matches, False otherwise
 
         Reference: #check_password - Password verification using bcrypt
         """
-        return bcrypt.checkpw(password.encode("utf-8"), self.password_hash.encode("utf-8"))
+        password_hash = self.password_hash
+        # bcrypt hashes are always 60 chars starting with "$2"; anything else would make
+        # checkpw raise, so reject it with a dummy check of comparable cost instead
+        if not password_hash or len(password_hash) != 60 or not password_hash.startswith("$2"):
+            return verify_dummy_password(rounds)
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
 
     def to_dict(self) -> dict:
         """
@@ -105,8 +211,8 @@ class User(Base):
             "email": self.email,
             "full_name": self.full_name,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": _isoformat_utc(cast(Optional[datetime], self.created_at)),
+            "updated_at": _isoformat_utc(cast(Optional[datetime], self.updated_at)),
         }
 
     def __repr__(self) -> str:
@@ -129,18 +235,49 @@ class DatabaseManager:
         Args:
             database_url: SQLAlchemy database URL (default: SQLite in data/ directory)
         """
-        self.engine = create_engine(database_url, echo=False)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        engine_options: Dict[str, Any] = {"echo": False}
+        if _is_memory_sqlite(database_url):
+            # One shared connection keeps the in-memory database alive for the engine's lifetime
+            engine_options.update(poolclass=StaticPool, connect_args={"check_same_thread": False})
+        elif not database_url.startswith("sqlite"):
+            # Keep warm connections for networked backends instead of reconnecting per request
+            engine_options.update(pool_size=20, max_overflow=10, pool_pre_ping=True, pool_recycle=1800)
+
+        self.engine = create_engine(database_url, **engine_options)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        # expire_on_commit=False lets committed objects be serialized without reload SELECTs
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+        # Thread-local session registry for request handlers; call Session.remove() at teardown
+        self.Session = scoped_session(self.SessionLocal)
 
     def create_tables(self) -> None:
         """
         Create all database tables if they don't exist.
 
-        Safe to call multiple times - only creates missing tables.
+        Safe to call multiple times - only creates missing tables. File-backed SQLite
+        databases record a schema fingerprint in ``PRAGMA user_version`` so warm starts
+        against an up-to-date file skip the per-table existence checks; any model change
+        alters the fingerprint and runs ``create_all`` again.
 
         Reference: #create_tables - Database schema initialization
         """
+        if not self._is_file_sqlite():
+            Base.metadata.create_all(self.engine)
+            return
+
+        schema_version = _schema_version()
+        with self.engine.connect() as connection:
+            if connection.exec_driver_sql("PRAGMA user_version").scalar() == schema_version:
+                return
+
         Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql(f"PRAGMA user_version = {schema_version}")
+
+    def _is_file_sqlite(self) -> bool:
+        """Whether the engine points at an on-disk SQLite database (not ``:memory:``)."""
+        return self.engine.dialect.name == "sqlite" and not _is_memory_sqlite(self.engine.url)
 
     def get_session(self):
         """
@@ -149,6 +286,11 @@ class DatabaseManager:
         Returns:
             SQLAlchemy session object
 
+        Note:
+            Request handlers use the thread-local ``Session`` registry instead, which the
+            app removes at teardown; this method is for scripts and tests that manage the
+            session lifecycle themselves.
+
         Usage:
             session = db_manager.get_session()
             try:
@@ -173,3 +315,7 @@ class DatabaseManager:
         Reference: #drop_tables - Database cleanup (testing only)
         """
         Base.metadata.drop_all(self.engine)
+        if self._is_file_sqlite():
+            # Clear the warm-start marker so the next create_tables() rebuilds the schema
+            with self.engine.begin() as connection:
+                connection.exec_driver_sql("PRAGMA user_version = 0")
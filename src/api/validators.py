@@ -8,7 +8,19 @@ Reference: #validators.py - Input validation and security checks
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
+import string
+from typing import Dict, Final, FrozenSet, List, Optional, Pattern, Tuple, Union
+
+# Patterns are compiled once at import instead of on every request
+# RFC 5322 compliant email regex (simplified but secure)
+_EMAIL_RE: Final[Pattern[str]] = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# Username must start with alphanumeric and contain only alphanumeric, underscore, hyphen
+_USERNAME_RE: Final[Pattern[str]] = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$")
+
+# Password character classes, checked by set membership in a single pass
+_UPPERCASE: Final[FrozenSet[str]] = frozenset(string.ascii_uppercase)
+_LOWERCASE: Final[FrozenSet[str]] = frozenset(string.ascii_lowercase)
+_SPECIAL_CHARACTERS: Final[FrozenSet[str]] = frozenset("!@#$%^&*()_+-=[]{};':\"\\|,.<>/?")
 
 
 def validate_email(email: str) -> Tuple[bool, Optional[str]]:
@@ -26,10 +38,7 @@ def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     if not email:
         return False, "Email is required"
 
-    # RFC 5322 compliant email regex (simplified but secure)
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-    if not re.match(email_pattern, email):
+    if not _EMAIL_RE.match(email):
         return False, "Invalid email format"
 
     if len(email) > 120:
@@ -64,8 +73,7 @@ def validate_username(username: str) -> Tuple[bool, Optional[str]]:
     if len(username) > 50:
         return False, "Username must be less than 50 characters"
 
-    # Username must start with alphanumeric and contain only alphanumeric, underscore, hyphen
-    if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$", username):
+    if not _USERNAME_RE.match(username):
         return False, "Username must start with letter/number and contain only letters, numbers, underscores, and hyphens"
 
     return True, None
@@ -93,32 +101,49 @@ def validate_password(password: str) -> Tuple[bool, Optional[str]]:
     if not password:
         return False, "Password is required"
 
-    if len(password) < 8:
+    length = len(password)
+
+    if length < 8:
         return False, "Password must be at least 8 characters"
 
-    if len(password) > 128:
+    if length > 128:
         return False, "Password must be less than 128 characters"
 
-    # Check for uppercase
-    if not re.search(r"[A-Z]", password):
+    # Single pass over the password for all four character classes, stopping once all are seen
+    has_upper = has_lower = has_digit = has_special = False
+    for char in password:
+        if char in _UPPERCASE:
+            has_upper = True
+        elif char in _LOWERCASE:
+            has_lower = True
+        elif char.isdecimal():  # Same Unicode decimal-digit class as regex \d
+            has_digit = True
+        elif char in _SPECIAL_CHARACTERS:
+            has_special = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit and has_special:
+            break
+
+    # Report the first missing class in a fixed order
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
 
-    # Check for lowercase
-    if not re.search(r"[a-z]", password):
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
 
-    # Check for digit
-    if not re.search(r"\d", password):
+    if not has_digit:
         return False, "Password must contain at least one digit"
 
-    # Check for special character
-    if not re.search(r"[!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>/?]", password):
+    if not has_special:
         return False, "Password must contain at least one special character"
 
     return True, None
 
 
-def validate_registration_data(username: str, email: str, password: str, full_name: Optional[str] = None) -> Dict:
+def validate_registration_data(
+    username: str, email: str, password: str, full_name: Optional[str] = None
+) -> Dict[str, Union[bool, List[str]]]:
     """
     Validate all registration data fields.
 
@@ -135,21 +160,21 @@ def validate_registration_data(username: str, email: str, password: str, full_na
 
     Reference: #validate_registration_data - Complete registration validation
     """
-    errors = []
+    errors: List[str] = []
 
     # Validate username
     username_valid, username_error = validate_username(username)
-    if not username_valid:
+    if not username_valid and username_error is not None:
         errors.append(username_error)
 
     # Validate email
     email_valid, email_error = validate_email(email)
-    if not email_valid:
+    if not email_valid and email_error is not None:
         errors.append(email_error)
 
     # Validate password
     password_valid, password_error = validate_password(password)
-    if not password_valid:
+    if not password_valid and password_error is not None:
         errors.append(password_error)
 
     # Validate optional full_name
@@ -17,13 +17,22 @@ Created: November 2025
 """
 
 import json
+import os
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from src.core.file_io import ensure_parent_dir
 
+# Optional fast JSON encoder/decoder for the usage log (falls back to stdlib json)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class GPT5CostTracker:
     """
@@ -65,6 +74,7 @@ class GPT5CostTracker:
         self.log_path = Path(self.log_file)
         ensure_parent_dir(self.log_path)
         self.history = self._load_history()
+        self._persisted_count = len(self.history)  # Entries already in the log file
         
         # Cache for parsed dates to avoid repeated parsing
         self._date_cache: Dict[str, datetime] = {}
@@ -73,17 +83,70 @@ class GPT5CostTracker:
         """Load cost history from log file."""
         if self.log_path.exists():
             try:
-                with open(self.log_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                history: List[Dict]
+                if ORJSON_AVAILABLE:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                    history = orjson.loads(self.log_path.read_bytes())
+                else:
+                    with open(self.log_path, "r", encoding="utf-8") as f:
+                        history = json.load(f)
+                return history
             except (json.JSONDecodeError, FileNotFoundError):
                 return []
         return []
 
+    def _encode_json(self, data) -> bytes:
+        """
+        Encode log data as compact UTF-8 JSON bytes (orjson when available).
+
+        The log is machine-read, so it is written without indentation: roughly half
+        the bytes and a faster encoder path than pretty-printing.
+        """
+        if ORJSON_AVAILABLE:
+            # OPT_NON_STR_KEYS keeps json.dump's handling of int/float keys in metadata
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
     def _save_history(self):
-        """Save cost history to log file."""
-        with open(self.log_path, "w", encoding="utf-8") as f:
-            json.dump(self.history, f, indent=2)
+        """
+        Save cost history to log file.
+
+        Performance optimization: Entries added since the last save are appended
+        in place, so each save costs O(new entries) instead of rewriting the whole
+        log. Falls back to a full rewrite when the file can't be appended to.
+        """
+        new_entries = self.history[self._persisted_count :]
+        if not (self._persisted_count and self._append_history(new_entries)):
+            self.log_path.write_bytes(self._encode_json(self.history))
+        self._persisted_count = len(self.history)
         self._unsaved_entries = 0  # Reset counter after save
+
+    def _append_history(self, entries: List[Dict]) -> bool:
+        """
+        Append entries to the saved JSON array without rewriting it.
+
+        Replaces the file's closing "]" with ",<entries>]", so the log stays a
+        valid JSON array.
+
+        Returns:
+            False if the file is missing or doesn't end with a non-empty array
+        """
+        if not entries:
+            return True
+        try:
+            with open(self.log_path, "r+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                tail_start = max(0, size - 64)
+                f.seek(tail_start)
+                tail = f.read().rstrip()
+                if not tail.endswith(b"]") or tail[:-1].rstrip().endswith(b"["):
+                    return False
+                f.seek(tail_start + len(tail) - 1)
+                f.write(b"," + b",".join(self._encode_json(entry) for entry in entries) + b"]")
+                f.truncate()
+        except FileNotFoundError:
+            return False
+        return True
     
     def save(self):
         """
@@ -106,6 +169,29 @@ class GPT5CostTracker:
             self._date_cache[timestamp_str] = datetime.fromisoformat(timestamp_str)
         return self._date_cache[timestamp_str]
 
+    def _get_entry_epoch(self, entry: Dict) -> float:
+        """
+        Get an entry's timestamp as POSIX seconds.
+
+        Performance optimization: Entries written by track_request carry a numeric
+        "epoch" field, so period filters are plain float comparisons. Older entries
+        without it fall back to cached ISO parsing.
+        """
+        epoch = entry.get("epoch")
+        if epoch is None:
+            epoch = self._get_parsed_date(entry["timestamp"]).timestamp()
+        return epoch
+
+    def _sum_cost_between(self, start: datetime, end: Optional[datetime] = None) -> float:
+        """Sum entry costs with start <= timestamp (< end, if given), both naive local times."""
+        start_epoch = start.timestamp()
+        end_epoch = end.timestamp() if end is not None else float("inf")
+        return sum(
+            entry["cost"]["total"]
+            for entry in self.history
+            if start_epoch <= self._get_entry_epoch(entry) < end_epoch
+        )
+
     def track_request(
         self,
         model: str,
@@ -150,8 +236,10 @@ class GPT5CostTracker:
         self.total_cost += total_cost
 
         # Create log entry
+        now = datetime.now()
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
+            "epoch": now.timestamp(),
             "model": model,
             "request_type": request_type,
             "tokens": {
@@ -197,43 +285,29 @@ class GPT5CostTracker:
         """
         Get total cost for today.
         
-        Performance optimization: Uses cached datetime parsing.
+        Performance optimization: Compares numeric epochs instead of parsing timestamps.
         """
-        today = datetime.now().date()
-        daily_cost = sum(
-            entry["cost"]["total"]
-            for entry in self.history
-            if self._get_parsed_date(entry["timestamp"]).date() == today
-        )
-        return daily_cost
+        start_of_day = datetime.combine(datetime.now().date(), time.min)
+        return self._sum_cost_between(start_of_day, start_of_day + timedelta(days=1))
 
     def get_weekly_cost(self) -> float:
         """
         Get total cost for the past 7 days.
         
-        Performance optimization: Uses cached datetime parsing.
+        Performance optimization: Compares numeric epochs instead of parsing timestamps.
         """
-        week_ago = datetime.now() - timedelta(days=7)
-        weekly_cost = sum(
-            entry["cost"]["total"] for entry in self.history 
-            if self._get_parsed_date(entry["timestamp"]) >= week_ago
-        )
-        return weekly_cost
+        return self._sum_cost_between(datetime.now() - timedelta(days=7))
 
     def get_monthly_cost(self) -> float:
         """
         Get total cost for the current month.
         
-        Performance optimization: Uses cached datetime parsing and single comparison.
+        Performance optimization: Compares numeric epochs instead of parsing timestamps.
         """
-        today = datetime.now()
-        monthly_cost = sum(
-            entry["cost"]["total"]
-            for entry in self.history
-            if (parsed := self._get_parsed_date(entry["timestamp"])) and
-               parsed.month == today.month and parsed.year == today.year
-        )
-        return monthly_cost
+        start_of_month = datetime.combine(datetime.now().date().replace(day=1), time.min)
+        # Day 1 + 32 days always lands in the following month
+        start_of_next_month = (start_of_month + timedelta(days=32)).replace(day=1)
+        return self._sum_cost_between(start_of_month, start_of_next_month)
 
     def get_cost_by_model(self) -> Dict[str, float]:
         """Get cost breakdown by model."""
@@ -278,10 +352,10 @@ class GPT5CostTracker:
         """
         Print detailed cost report.
         
-        Performance optimization: Uses cached datetime parsing for filtering.
+        Performance optimization: Filters on numeric epochs instead of parsing timestamps.
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        recent = [e for e in self.history if self._get_parsed_date(e["timestamp"]) >= cutoff]
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        recent = [e for e in self.history if self._get_entry_epoch(e) >= cutoff]
 
         print("\n" + "=" * 80)
         print(f"  GPT-5 Cost Report - Last {days} Days")
@@ -403,25 +477,25 @@ class GPT5CostTracker:
                 "output_cost",
                 "total_cost",
             ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for entry in self.history:
-                writer.writerow(
-                    {
-                        "timestamp": entry["timestamp"],
-                        "model": entry["model"],
-                        "request_type": entry["request_type"],
-                        "input_tokens": entry["tokens"]["input"],
-                        "cached_tokens": entry["tokens"]["cached_input"],
-                        "output_tokens": entry["tokens"]["output"],
-                        "total_tokens": entry["tokens"]["total"],
-                        "input_cost": entry["cost"]["input"],
-                        "cached_cost": entry["cost"]["cached_input"],
-                        "output_cost": entry["cost"]["output"],
-                        "total_cost": entry["cost"]["total"],
-                    }
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            # Plain rows in fieldnames order; DictWriter would re-probe each dict per field
+            writer.writerows(
+                (
+                    entry["timestamp"],
+                    entry["model"],
+                    entry["request_type"],
+                    entry["tokens"]["input"],
+                    entry["tokens"]["cached_input"],
+                    entry["tokens"]["output"],
+                    entry["tokens"]["total"],
+                    entry["cost"]["input"],
+                    entry["cost"]["cached_input"],
+                    entry["cost"]["output"],
+                    entry["cost"]["total"],
                 )
+                for entry in self.history
+            )
 
         print(f"✅ Cost data exported to {output_file}")
 
@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Any, List
 
 # Standard column ordering for CIS audit data
-CIS_AUDIT_COLUMNS = [
+CIS_AUDIT_COLUMNS = (
     "ControlId",
     "Title",
     "Severity",
@@ -25,7 +25,10 @@ CIS_AUDIT_COLUMNS = [
     "Evidence",
     "Reference",
     "Timestamp",
-]
+)
+
+# Template row copied per audit item instead of rebuilding it column by column
+_EMPTY_AUDIT_ROW = dict.fromkeys(CIS_AUDIT_COLUMNS, "")
 
 
 def load_json_with_bom(json_path: Path, exit_on_error: bool = True) -> Any:
@@ -88,7 +91,7 @@ def normalize_audit_data(data: Any) -> List[dict]:
 
     normalized_results = []
     for audit_item in results:
-        normalized_item = {column_name: "" for column_name in CIS_AUDIT_COLUMNS}
+        normalized_item = _EMPTY_AUDIT_ROW.copy()
         normalized_item.update(audit_item)
         normalized_results.append(normalized_item)
 
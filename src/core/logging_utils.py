@@ -0,0 +1,73 @@
+"""
+Shared logging setup for long-running M365 Security Toolkit services.
+
+Log records are handed to a queue by the calling thread and written to the
+console and a size-capped log file by one background listener thread, so
+request/tool handlers never block on log I/O.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Background writer for log records, started by the first configure_queue_logging() call
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_queue_logging(
+    log_file: Path,
+    max_bytes: int = 10_000_000,
+    backup_count: int = 5,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[logging.handlers.QueueListener]:
+    """
+    Route logging through a queue to a rotating log file and the console.
+
+    Does nothing if the logger already has handlers, so repeated calls (or an
+    application that configured logging itself) don't stack duplicate handlers.
+
+    Args:
+        log_file: Log file path; its parent directory is created if needed
+        max_bytes: Rotate the log file once it reaches this size
+        backup_count: Number of rotated log files to keep
+        logger: Logger to configure (default: the root logger)
+
+    Returns:
+        The started listener, or None if logging was already configured
+    """
+    global _log_listener
+    target_logger = logger if logger is not None else logging.getLogger()
+    if target_logger.handlers:
+        return None
+
+    log_file = Path(log_file)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    # delay=True defers opening the file until the first record is written
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+    )
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    # Each record is written as soon as the listener dequeues it, so nothing sits in a
+    # buffer waiting to be lost on a crash; the IO cost stays on the listener thread
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _log_listener.start()
+    # Registered after logging's own exit hook, so it runs first and drains the queue
+    # before logging.shutdown() flushes and closes the handlers
+    atexit.register(_log_listener.stop)
+
+    target_logger.setLevel(logging.INFO)
+    target_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return _log_listener
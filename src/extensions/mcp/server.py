@@ -29,6 +29,11 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Allow running as a script (python src/extensions/mcp/server.py) as well as a module
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from src.core.logging_utils import configure_queue_logging  # noqa: E402
+
 # MCP imports
 try:
     from mcp import McpError
@@ -56,15 +61,8 @@ class M365SecurityMCPServer:
         self.setup_tools()
 
     def setup_logging(self):
-        """Configure logging for the MCP server"""
-        log_dir = Path.home() / ".aitk" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler(log_dir / "m365_mcp_server.log"), logging.StreamHandler()],
-        )
+        """Configure logging for the MCP server (safe to call more than once)"""
+        configure_queue_logging(Path.home() / ".aitk" / "logs" / "m365_mcp_server.log")
         self.logger = logging.getLogger(__name__)
         self.logger.info("M365 Security MCP Server initializing...")
 
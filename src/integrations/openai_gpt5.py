@@ -20,8 +20,10 @@ Created: November 2025
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, List, Literal, Optional
 
+from azure.core.credentials import TokenCredential
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from openai import OpenAI
 
@@ -34,6 +36,24 @@ except ImportError:
     COST_TRACKING_ENABLED = False
 
 
+@lru_cache(maxsize=1)
+def _default_credential() -> DefaultAzureCredential:
+    """
+    Return the process-wide DefaultAzureCredential shared by all Entra ID clients.
+
+    Sharing one credential means one token acquisition and refresh per process
+    instead of one per GPT5Client instance.
+    """
+    # Skip developer-desktop probes (token cache, VS Code, PowerShell, browser); each does
+    # filesystem/subprocess work and can add seconds to first token acquisition when absent
+    return DefaultAzureCredential(
+        exclude_shared_token_cache_credential=True,
+        exclude_visual_studio_code_credential=True,
+        exclude_powershell_credential=True,
+        exclude_interactive_browser_credential=True,
+    )
+
+
 class GPT5Client:
     """
     Client for OpenAI GPT-5 models with Azure OpenAI Service integration.
@@ -50,6 +70,7 @@ class GPT5Client:
         api_key: Optional[str] = None,
         use_entra_id: bool = False,
         model: str = "gpt-5",
+        credential: Optional[TokenCredential] = None,
     ):
         """
         Initialize GPT-5 client.
@@ -59,6 +80,9 @@ class GPT5Client:
             api_key: Azure OpenAI API key (if not using Entra ID)
             use_entra_id: Use Azure Entra ID authentication (keyless)
             model: Model deployment name (default: gpt-5)
+            credential: Azure credential for Entra ID auth (default: a shared DefaultAzureCredential limited
+                to environment, workload/managed identity and Azure CLI). Pass e.g. ManagedIdentityCredential()
+                in production to skip the credential chain entirely.
 
         Environment Variables:
             AZURE_OPENAI_ENDPOINT: Azure OpenAI endpoint URL
@@ -79,7 +103,7 @@ class GPT5Client:
         if self.use_entra_id:
             # Use Azure Entra ID authentication (keyless)
             token_provider = get_bearer_token_provider(
-                DefaultAzureCredential(),
+                credential if credential is not None else _default_credential(),
                 "https://cognitiveservices.azure.com/.default",
             )
             self.client = OpenAI(
@@ -31,6 +31,8 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
+from src.core.logging_utils import configure_queue_logging
+
 # MCP imports
 try:
     from mcp import ErrorData, McpError
@@ -85,15 +87,8 @@ class M365MCPServer:
         self._setup_management_tools()
 
     def setup_logging(self) -> None:
-        """Configure logging for the MCP server."""
-        log_dir = Path.home() / ".aitk" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler(log_dir / "m365_mcp_server.log"), logging.StreamHandler()],
-        )
+        """Configure logging for the MCP server (safe to call more than once)."""
+        configure_queue_logging(Path.home() / ".aitk" / "logs" / "m365_mcp_server.log")
         self.logger = logging.getLogger(__name__)
         self.logger.info("M365 MCP Server initializing...")
 
@@ -0,0 +1,127 @@
+"""
+Shared pytest fixtures for the Flask authentication API tests.
+
+One app (and one in-memory schema) is built per test session; each test
+gets an empty database and fresh per-app caches through the ``db_manager``
+fixture.
+
+Reference: conftest.py - Session-scoped app fixtures for API tests
+"""
+
+import uuid
+from functools import lru_cache
+
+import bcrypt
+import pytest
+
+from src.api.app import create_app
+from src.api.bloom_filter import BloomFilter
+from src.api.login_cache import FailedLoginCache
+from src.api.models import Base, User
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Flask app shared by the whole test session.
+
+    Uses a named shared-cache in-memory database so extra apps or managers
+    created inside a test can attach to the same data, and the minimum
+    bcrypt cost so hashing does not dominate test time.
+
+    Reference: #app - Session-scoped Flask app fixture
+    """
+    app = create_app(
+        {
+            "TESTING": True,
+            "DATABASE_URL": f"sqlite:///file:auth_test_{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true",
+            "SECRET_KEY": "test-secret-key",
+            "BCRYPT_ROUNDS": 4,
+        }
+    )
+    yield app
+    app.extensions["db_manager"].engine.dispose()
+
+
+@pytest.fixture
+def db_manager(app):
+    """
+    The shared app's DatabaseManager, isolated from the next test.
+
+    Resets the per-app auth caches before the test and deletes all rows after
+    it. Rows are deleted rather than rolled back because the request handlers
+    commit through their own scoped sessions.
+
+    Reference: #db_manager - Per-test cleanup for the shared app
+    """
+    app.extensions["registered_identities"] = BloomFilter()
+    app.extensions["failed_login_cache"] = FailedLoginCache()
+    manager = app.extensions["db_manager"]
+    yield manager
+    manager.Session.remove()
+    with manager.engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@pytest.fixture
+def db_session(db_manager):
+    """
+    Standalone session on the shared database, closed after the test.
+
+    Reference: #db_session - Session for direct database assertions
+    """
+    session = db_manager.get_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def shared_client(app):
+    """
+    Single test client for the shared app; the auth API keeps no cookie state.
+
+    Reference: #shared_client - Session-scoped Flask test client
+    """
+    return app.test_client()
+
+
+@pytest.fixture
+def client(shared_client, db_manager):
+    """
+    Shared test client, with the database emptied after each test.
+
+    Reference: #client - Flask test client fixture
+    """
+    return shared_client
+
+
+@lru_cache(maxsize=8)
+def _cached_hash(password: str) -> str:
+    """Bcrypt hash of ``password`` at the test cost factor, computed once per process."""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+
+@pytest.fixture
+def registered_user(app, db_manager):
+    """
+    Insert one existing user directly and return its credentials.
+
+    Skips the register endpoint and reuses a cached hash, so only tests that
+    exercise registration itself pay for a bcrypt hash.
+
+    Reference: #registered_user - Pre-registered account for login/duplicate tests
+    """
+    user_data = {"username": "logintest", "email": "login@example.com", "password": "SecurePass123!"}
+    with db_manager.get_session() as session:
+        session.add(
+            User(
+                username=user_data["username"],
+                email=user_data["email"],
+                password_hash=_cached_hash(user_data["password"]),
+            )
+        )
+        session.commit()
+    # Mirror what registration records, so duplicate checks still run for this user
+    app.extensions["registered_identities"].update((user_data["username"], user_data["email"]))
+    return user_data
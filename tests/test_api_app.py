@@ -10,10 +10,47 @@ Reference: test_api_app.py - Comprehensive tests for Flask app setup
 import json
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.api.app import create_app
 
 
+@pytest.fixture(scope='module')
+def default_app():
+    """
+    App built with the default configuration, shared by read-only tests.
+
+    Reference: #default_app - Module-scoped default app fixture
+    """
+    return create_app()
+
+
+@pytest.fixture(scope='module')
+def testing_app():
+    """
+    App built with TESTING enabled, shared by read-only tests.
+
+    Reference: #testing_app - Module-scoped testing app fixture
+    """
+    return create_app({'TESTING': True})
+
+
+@pytest.fixture(scope='module')
+def error_app():
+    """
+    App with a route that always raises, built once for error handler tests.
+
+    Reference: #error_app - Module-scoped app for 500 handling
+    """
+    app = create_app({'TESTING': True, 'PROPAGATE_EXCEPTIONS': False})
+
+    @app.route('/test-error')
+    def trigger_error():
+        raise ValueError("Test error")
+
+    return app
+
+
 class TestFlaskAppConfiguration:
     """
     Test suite for Flask application configuration and initialization.
@@ -28,13 +65,13 @@ class TestFlaskAppConfiguration:
     Reference: #TestFlaskAppConfiguration - Main test class for Flask app
     """
 
-    def test_app_creation_default_config(self):
+    def test_app_creation_default_config(self, default_app):
         """
         Test Flask app creation with default configuration.
 
         Reference: #test_app_creation_default_config - Default config test
         """
-        app = create_app()
+        app = default_app
 
         assert app is not None
         assert app.config['TESTING'] is False
@@ -60,25 +97,25 @@ class TestFlaskAppConfiguration:
         assert app.config['SECRET_KEY'] == 'test-secret-12345'
         assert app.config['DATABASE_URL'] == 'sqlite:///test.db'
 
-    def test_app_has_auth_blueprint(self):
+    def test_app_has_auth_blueprint(self, testing_app):
         """
         Test that authentication blueprint is registered.
 
         Reference: #test_app_has_auth_blueprint - Blueprint registration
         """
-        app = create_app({'TESTING': True})
+        app = testing_app
 
         # Check blueprint is registered
         assert 'auth' in app.blueprints
         assert app.blueprints['auth'].url_prefix == '/api/auth'
 
-    def test_cors_enabled(self):
+    def test_cors_enabled(self, testing_app):
         """
         Test that CORS is properly configured for API endpoints.
 
         Reference: #test_cors_enabled - CORS configuration test
         """
-        app = create_app({'TESTING': True})
+        app = testing_app
         client = app.test_client()
 
         # Make request to check CORS is configured
@@ -87,13 +124,13 @@ class TestFlaskAppConfiguration:
         # CORS should allow requests (either headers present or request succeeds)
         assert response.status_code == 200 or 'Access-Control-Allow-Origin' in response.headers
 
-    def test_health_endpoint_exists(self):
+    def test_health_endpoint_exists(self, testing_app):
         """
         Test that health check endpoint is accessible.
 
         Reference: #test_health_endpoint_exists - Health endpoint test
         """
-        app = create_app({'TESTING': True})
+        app = testing_app
         client = app.test_client()
 
         response = client.get('/api/auth/health')
@@ -102,13 +139,13 @@ class TestFlaskAppConfiguration:
         assert response.status_code == 200
         assert data['status'] == 'healthy'
 
-    def test_404_error_handler(self):
+    def test_404_error_handler(self, testing_app):
         """
         Test custom 404 error handler.
 
         Reference: #test_404_error_handler - Error handling test
         """
-        app = create_app({'TESTING': True})
+        app = testing_app
         client = app.test_client()
 
         response = client.get('/nonexistent-endpoint')
@@ -117,20 +154,13 @@ class TestFlaskAppConfiguration:
         # Should return JSON for API endpoints or HTML for others
         assert response.content_type in ['application/json', 'text/html; charset=utf-8']
 
-    def test_500_error_handler(self):
+    def test_500_error_handler(self, error_app):
         """
         Test that 500 errors are handled gracefully.
 
         Reference: #test_500_error_handler - Server error handling
         """
-        app = create_app({'TESTING': True, 'PROPAGATE_EXCEPTIONS': False})
-
-        # Create route that raises exception
-        @app.route('/test-error')
-        def trigger_error():
-            raise ValueError("Test error")
-
-        client = app.test_client()
+        client = error_app.test_client()
         
         # In testing mode, exceptions might propagate
         # Test that app doesn't crash completely
@@ -142,25 +172,25 @@ class TestFlaskAppConfiguration:
             # If exception propagates in testing mode, that's also acceptable
             pass
 
-    def test_app_context_available(self):
+    def test_app_context_available(self, testing_app):
         """
         Test that Flask app context is properly set up.
 
         Reference: #test_app_context_available - Context management
         """
-        app = create_app({'TESTING': True})
+        app = testing_app
 
         with app.app_context():
             # Database and other extensions should be accessible
             assert app.config is not None
 
-    def test_testing_mode_disables_features(self):
+    def test_testing_mode_disables_features(self, testing_app):
         """
         Test that TESTING mode disables certain production features.
 
         Reference: #test_testing_mode_disables_features - Testing mode behavior
         """
-        app = create_app({'TESTING': True})
+        app = testing_app
 
         assert app.config['TESTING'] is True
         # In testing mode, certain features should be disabled for safety
@@ -177,13 +207,13 @@ class TestFlaskAppConfiguration:
 
         assert app.config.get('DATABASE_URL') == custom_db
 
-    def test_secret_key_required(self):
+    def test_secret_key_required(self, default_app):
         """
         Test that SECRET_KEY is set (required for sessions).
 
         Reference: #test_secret_key_required - Security requirement
         """
-        app = create_app()
+        app = default_app
 
         # SECRET_KEY must be set for secure sessions
         assert 'SECRET_KEY' in app.config
@@ -202,13 +232,13 @@ class TestFlaskAppConfiguration:
         assert app1.config['SECRET_KEY'] != app2.config['SECRET_KEY']
         assert app1 is not app2
 
-    def test_app_name(self):
+    def test_app_name(self, default_app):
         """
         Test that app has correct name.
 
         Reference: #test_app_name - App naming
         """
-        app = create_app()
+        app = default_app
 
         # Should have meaningful app name
         assert app.name is not None
@@ -230,45 +260,46 @@ class TestFlaskAppConfiguration:
         if config_key in app.config:
             assert isinstance(app.config[config_key], expected_type)
 
-
-class TestFlaskAppEnvironment:
-    """
-    Test suite for environment-specific app configurations.
-
-    Reference: #TestFlaskAppEnvironment - Environment config tests
-    """
-
-    def test_development_config(self):
+    def test_sqlite_data_directory_created_once(self, tmp_path):
         """
-        Test development configuration.
+        Test that the SQLite data directory is created and not re-created per app.
 
-        Reference: #test_development_config - Development mode
+        Reference: #test_sqlite_data_directory_created_once - Directory creation caching
         """
-        app = create_app({'ENV': 'development', 'DEBUG': True})
+        db_dir = tmp_path / "nested" / "data"
+        database_url = f"sqlite:///{db_dir / 'users.db'}"
 
-        assert app.config.get('DEBUG') is True
-        assert app.config.get('ENV') == 'development'
+        create_app({'TESTING': True, 'DATABASE_URL': database_url})
+        assert db_dir.is_dir()
 
-    def test_production_config(self):
-        """
-        Test production configuration.
+        with patch('src.api.app.os.makedirs') as mock_makedirs:
+            create_app({'TESTING': True, 'DATABASE_URL': database_url})
+        mock_makedirs.assert_not_called()
 
-        Reference: #test_production_config - Production mode
-        """
-        app = create_app({'ENV': 'production', 'DEBUG': False})
 
-        assert app.config.get('DEBUG') is False
-        assert app.config.get('ENV') == 'production'
+class TestFlaskAppEnvironment:
+    """
+    Test suite for environment-specific app configurations.
 
-    def test_testing_config(self):
+    Reference: #TestFlaskAppEnvironment - Environment config tests
+    """
+
+    @pytest.mark.parametrize("config,expected", [
+        ({'ENV': 'development', 'DEBUG': True}, {'ENV': 'development', 'DEBUG': True}),
+        ({'ENV': 'production', 'DEBUG': False}, {'ENV': 'production', 'DEBUG': False}),
+        ({'TESTING': True}, {'TESTING': True}),
+    ], ids=['development', 'production', 'testing'])
+    def test_environment_config(self, config, expected):
         """
-        Test testing configuration.
+        Test development, production and testing configurations.
 
-        Reference: #test_testing_config - Testing mode
+        Reference: #test_environment_config - Environment mode matrix
         """
-        app = create_app({'TESTING': True})
+        app = create_app(config)
 
-        assert app.config['TESTING'] is True
+        for key, value in expected.items():
+            assert app.config.get(key) == value
+            assert type(app.config.get(key)) is type(value)
 
 
 if __name__ == '__main__':
@@ -8,17 +8,18 @@ Reference: test_auth_api.py - Comprehensive test suite for authentication
 """
 
 import json
-import os
-import tempfile
-import unittest
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
 
 from src.api.app import create_app
-from src.api.models import DatabaseManager, User
+from src.api.auth_routes import _ERR_CREDENTIALS_REQUIRED, _error_response
+from src.api.models import DEFAULT_BCRYPT_ROUNDS, DatabaseManager, User
 
 
-class TestAuthenticationAPI(unittest.TestCase):
+class TestAuthenticationAPI:
     """
     Test suite for authentication API endpoints.
 
@@ -31,84 +32,25 @@ class TestAuthenticationAPI(unittest.TestCase):
         - Error handling (missing data, server errors)
         - Account status checks
 
+    Uses the session-scoped ``app`` and per-test ``client`` fixtures from conftest.py.
+
     Reference: #TestAuthenticationAPI - Main test class for auth endpoints
     """
 
-    def setUp(self):
-        """
-        Set up test environment before each test.
-
-        Creates temporary database and Flask test client.
-
-        Reference: #setUp - Test fixture initialization
-        """
-        # Create temporary database file
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-
-        # Create Flask app with test configuration
-        self.app = create_app(
-            {
-                "TESTING": True,
-                "DATABASE_URL": f"sqlite:///{self.db_path}",
-                "SECRET_KEY": "test-secret-key",
-            }
-        )
-
-        self.client = self.app.test_client()
-
-        # Store database URL for direct database operations
-        self.database_url = f"sqlite:///{self.db_path}"
-
-    def tearDown(self):
-        """
-        Clean up test environment after each test.
-
-        Removes temporary database file.
-
-        Reference: #tearDown - Test cleanup
-        """
-        # Close database connections first
-        # This is critical on Windows to release file locks
-        if hasattr(self, 'app'):
-            with self.app.app_context():
-                # Force close any database connections
-                from sqlalchemy import create_engine
-                engine = create_engine(self.database_url)
-                engine.dispose()
-        
-        # Close file descriptor
-        try:
-            os.close(self.db_fd)
-        except (OSError, ValueError):
-            pass  # Already closed
-        
-        # Wait a moment for file locks to release (Windows-specific)
-        import time
-        time.sleep(0.1)
-        
-        # Remove database file
-        try:
-            os.unlink(self.db_path)
-        except (OSError, PermissionError) as e:
-            # On Windows, file may still be locked
-            # Schedule for deletion on next run
-            print(f"Warning: Could not delete temp file {self.db_path}: {e}")
-            pass
-
-    def test_health_check(self):
+    def test_health_check(self, client):
         """
         Test health check endpoint.
 
         Reference: #test_health_check - API health monitoring test
         """
-        response = self.client.get("/api/auth/health")
+        response = client.get("/api/auth/health")
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(data["status"], "healthy")
-        self.assertEqual(data["service"], "Authentication API")
+        assert response.status_code == 200
+        assert data["status"] == "healthy"
+        assert data["service"] == "Authentication API"
 
-    def test_register_user_success(self):
+    def test_register_user_success(self, client, db_session):
         """
         Test successful user registration.
 
@@ -134,110 +76,61 @@ class TestAuthenticationAPI(unittest.TestCase):
         }
 
         # Send registration request
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
         # Validate response
-        self.assertEqual(response.status_code, 201)
-        self.assertTrue(data["success"])
-        self.assertEqual(data["message"], "User registered successfully")
-        self.assertIn("user", data)
+        assert response.status_code == 201
+        assert data["success"]
+        assert data["message"] == "User registered successfully"
+        assert "user" in data
 
         # Validate user data
         user = data["user"]
-        self.assertEqual(user["username"], "testuser")
-        self.assertEqual(user["email"], "test@example.com")
-        self.assertEqual(user["full_name"], "Test User")
-        self.assertTrue(user["is_active"])
-        self.assertIsNotNone(user["created_at"])
+        assert user["username"] == "testuser"
+        assert user["email"] == "test@example.com"
+        assert user["full_name"] == "Test User"
+        assert user["is_active"]
+        assert user["created_at"] is not None
 
         # Ensure password is NOT in response
-        self.assertNotIn("password", user)
-        self.assertNotIn("password_hash", user)
+        assert "password" not in user
+        assert "password_hash" not in user
 
         # Verify database record exists
-        db_manager = DatabaseManager(self.database_url)
-        session = db_manager.get_session()
-        db_user = session.query(User).filter_by(username="testuser").first()
-
-        self.assertIsNotNone(db_user)
-        self.assertEqual(db_user.email, "test@example.com")
-        self.assertTrue(db_user.check_password("SecurePass123!"))  # Integration with #check_password
+        db_user = db_session.scalar(select(User).where(User.username == "testuser"))
 
-        session.close()
+        assert db_user is not None
+        assert db_user.email == "test@example.com"
+        assert db_user.check_password("SecurePass123!")  # Integration with #check_password
 
-    def test_register_user_duplicate_username(self):
+    @pytest.mark.parametrize(
+        "field,expected_message",
+        [("username", "Username already exists"), ("email", "Email already exists")],
+    )
+    def test_register_user_duplicate(self, client, registered_user, field, expected_message):
         """
-        Test registration with duplicate username.
+        Test registration with a username or email that is already taken.
 
         Validates:
             - 409 Conflict status code
-            - Appropriate error message
+            - Appropriate error message for the clashing field
 
-        Reference: #test_register_user_duplicate_username - Duplicate detection test
+        Reference: #test_register_user_duplicate - Duplicate detection test
         """
-        # Register first user
-        user_data = {
-            "username": "duplicate_user",
-            "email": "user1@example.com",
-            "password": "SecurePass123!",
-        }
+        user_data = {"username": "otheruser", "email": "other@example.com", "password": "SecurePass123!"}
+        user_data[field] = registered_user[field]
 
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
-
-        # Try to register with same username but different email
-        user_data2 = {
-            "username": "duplicate_user",
-            "email": "user2@example.com",
-            "password": "SecurePass123!",
-        }
-
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data2), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 409)
-        self.assertFalse(data["success"])
-        self.assertIn("Username already exists", data["message"])
-
-    def test_register_user_duplicate_email(self):
-        """
-        Test registration with duplicate email.
+        assert response.status_code == 409
+        assert not data["success"]
+        assert expected_message in data["message"]
 
-        Reference: #test_register_user_duplicate_email - Email uniqueness test
-        """
-        # Register first user
-        user_data = {
-            "username": "user1",
-            "email": "duplicate@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
-
-        # Try to register with same email but different username
-        user_data2 = {
-            "username": "user2",
-            "email": "duplicate@example.com",
-            "password": "SecurePass123!",
-        }
-
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data2), content_type="application/json"
-        )
-
-        data = json.loads(response.data)
-
-        self.assertEqual(response.status_code, 409)
-        self.assertFalse(data["success"])
-        self.assertIn("Email already exists", data["message"])
-
-    def test_register_user_invalid_email(self):
+    def test_register_user_invalid_email(self, client):
         """
         Test registration with invalid email format.
 
@@ -252,18 +145,16 @@ class TestAuthenticationAPI(unittest.TestCase):
             "password": "SecurePass123!",
         }
 
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
-        self.assertIn("Invalid email format", data["errors"])
+        assert response.status_code == 400
+        assert not data["success"]
+        assert "errors" in data
+        assert "Invalid email format" in data["errors"]
 
-    def test_register_user_weak_password(self):
+    def test_register_user_weak_password(self, client):
         """
         Test registration with weak password.
 
@@ -274,19 +165,17 @@ class TestAuthenticationAPI(unittest.TestCase):
         """
         user_data = {"username": "testuser", "email": "test@example.com", "password": "weak"}
 
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
+        assert response.status_code == 400
+        assert not data["success"]
+        assert "errors" in data
         # Should have multiple password errors
-        self.assertGreater(len(data["errors"]), 0)
+        assert len(data["errors"]) > 0
 
-    def test_register_user_short_username(self):
+    def test_register_user_short_username(self, client):
         """
         Test registration with username too short.
 
@@ -297,25 +186,23 @@ class TestAuthenticationAPI(unittest.TestCase):
         """
         user_data = {"username": "ab", "email": "test@example.com", "password": "SecurePass123!"}
 
-        response = self.client.post(
-            "/api/auth/register", data=json.dumps(user_data), content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("Username must be at least 3 characters", data["errors"])
+        assert response.status_code == 400
+        assert not data["success"]
+        assert "Username must be at least 3 characters" in data["errors"]
 
     # 🆕 NEW TESTS - Missing Request Body
 
-    def test_register_missing_request_body(self):
+    def test_register_missing_request_body(self, client):
         """
         Test registration without request body.
 
         Reference: #test_register_missing_request_body - Request validation test
         """
-        response = self.client.post(
+        response = client.post(
             "/api/auth/register",
             data=None,
             content_type="application/json"
@@ -324,29 +211,25 @@ class TestAuthenticationAPI(unittest.TestCase):
         data = json.loads(response.data)
 
         # Flask may return 500 for completely missing body, or 400 for empty body
-        self.assertIn(response.status_code, [400, 500])
-        self.assertFalse(data["success"])
+        assert response.status_code in [400, 500]
+        assert not data["success"]
 
-    def test_register_empty_json(self):
+    def test_register_empty_json(self, client):
         """
         Test registration with empty JSON object.
 
         Reference: #test_register_empty_json - Empty data validation
         """
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps({}),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json={})
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
+        assert response.status_code == 400
+        assert not data["success"]
         # Empty object will trigger validation errors for missing required fields
-        self.assertIn("message", data)
+        assert "message" in data
 
-    def test_register_missing_username(self):
+    def test_register_missing_username(self, client):
         """
         Test registration without username field.
 
@@ -357,19 +240,15 @@ class TestAuthenticationAPI(unittest.TestCase):
             "password": "SecurePass123!",
         }
 
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps(user_data),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
+        assert response.status_code == 400
+        assert not data["success"]
+        assert "errors" in data
 
-    def test_register_missing_email(self):
+    def test_register_missing_email(self, client):
         """
         Test registration without email field.
 
@@ -380,19 +259,15 @@ class TestAuthenticationAPI(unittest.TestCase):
             "password": "SecurePass123!",
         }
 
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps(user_data),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
+        assert response.status_code == 400
+        assert not data["success"]
+        assert "errors" in data
 
-    def test_register_missing_password(self):
+    def test_register_missing_password(self, client):
         """
         Test registration without password field.
 
@@ -403,104 +278,51 @@ class TestAuthenticationAPI(unittest.TestCase):
             "email": "test@example.com",
         }
 
-        response = self.client.post(
-            "/api/auth/register",
-            data=json.dumps(user_data),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/register", json=user_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertIn("errors", data)
+        assert response.status_code == 400
+        assert not data["success"]
+        assert "errors" in data
 
     # 🆕 NEW TESTS - Login Tests
 
-    def test_login_success(self):
+    @pytest.mark.parametrize(
+        "identifier_field,password,expected_status",
+        [
+            ("username", "SecurePass123!", 200),
+            ("email", "SecurePass123!", 200),
+            ("username", "WrongPassword123!", 401),
+        ],
+        ids=["username", "email", "invalid_password"],
+    )
+    def test_login(self, client, registered_user, identifier_field, password, expected_status):
         """
-        Test successful user login.
+        Test login by username or email, and rejection of a wrong password.
 
         Integration with:
             - #loginUser endpoint (auth_routes.py)
             - #check_password method (models.py) - bcrypt verification
 
-        Reference: #test_login_success - Login flow test
-        """
-        # First register a user
-        user_data = {
-            "username": "logintest",
-            "email": "login@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
-
-        # Now try to login
-        login_data = {"username": "logintest", "password": "SecurePass123!"}
-
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
-
-        data = json.loads(response.data)
-
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(data["success"])
-        self.assertEqual(data["message"], "Login successful")
-        self.assertIn("user", data)
-        self.assertEqual(data["user"]["username"], "logintest")
-
-    def test_login_with_email(self):
-        """
-        Test login using email instead of username.
-
-        Reference: #test_login_with_email - Alternative login method
+        Reference: #test_login - Login flow test
         """
-        # Register user
-        user_data = {
-            "username": "emaillogin",
-            "email": "emaillogin@example.com",
-            "password": "SecurePass123!",
-        }
+        login_data = {"username": registered_user[identifier_field], "password": password}
 
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
-
-        # Login with email
-        login_data = {"username": "emaillogin@example.com", "password": "SecurePass123!"}
-
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
+        response = client.post("/api/auth/login", json=login_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(data["success"])
-
-    def test_login_invalid_password(self):
-        """
-        Test login with incorrect password.
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert data["success"]
+            assert data["message"] == "Login successful"
+            assert data["user"]["username"] == registered_user["username"]
+        else:
+            assert not data["success"]
+            assert data["message"] == "Invalid credentials"
 
-        Reference: #test_login_invalid_password - Authentication failure test
-        """
-        # Register user
-        user_data = {
-            "username": "passtest",
-            "email": "passtest@example.com",
-            "password": "SecurePass123!",
-        }
-
-        self.client.post("/api/auth/register", data=json.dumps(user_data), content_type="application/json")
-
-        # Try login with wrong password
-        login_data = {"username": "passtest", "password": "WrongPassword123!"}
-
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
-
-        data = json.loads(response.data)
-
-        self.assertEqual(response.status_code, 401)
-        self.assertFalse(data["success"])
-        self.assertEqual(data["message"], "Invalid credentials")
-
-    def test_login_nonexistent_user(self):
+    def test_login_nonexistent_user(self, client):
         """
         Test login with non-existent username.
 
@@ -508,22 +330,22 @@ class TestAuthenticationAPI(unittest.TestCase):
         """
         login_data = {"username": "nonexistent", "password": "SecurePass123!"}
 
-        response = self.client.post("/api/auth/login", data=json.dumps(login_data), content_type="application/json")
+        response = client.post("/api/auth/login", json=login_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 401)
-        self.assertFalse(data["success"])
+        assert response.status_code == 401
+        assert not data["success"]
         # Should return generic error to prevent username enumeration
-        self.assertEqual(data["message"], "Invalid credentials")
+        assert data["message"] == "Invalid credentials"
 
-    def test_login_missing_request_body(self):
+    def test_login_missing_request_body(self, client):
         """
         Test login without request body.
 
         Reference: #test_login_missing_request_body - Request validation test
         """
-        response = self.client.post(
+        response = client.post(
             "/api/auth/login",
             data=None,
             content_type="application/json"
@@ -532,16 +354,16 @@ class TestAuthenticationAPI(unittest.TestCase):
         data = json.loads(response.data)
 
         # Flask may return 500 for completely missing body
-        self.assertIn(response.status_code, [400, 500])
-        self.assertFalse(data["success"])
+        assert response.status_code in [400, 500]
+        assert not data["success"]
         # Message could be "Request body is required" or wrapped in "Server error"
-        self.assertTrue(
-            "Request body is required" in data["message"] or
-            "Server error" in data["message"] or
-            "Bad Request" in data["message"]
+        assert (
+            "Request body is required" in data["message"]
+            or "Server error" in data["message"]
+            or "Bad Request" in data["message"]
         )
 
-    def test_login_missing_username(self):
+    def test_login_missing_username(self, client):
         """
         Test login without username field.
 
@@ -549,19 +371,15 @@ class TestAuthenticationAPI(unittest.TestCase):
         """
         login_data = {"password": "SecurePass123!"}
 
-        response = self.client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertEqual(data["message"], "Username and password are required")
+        assert response.status_code == 400
+        assert not data["success"]
+        assert data["message"] == "Username and password are required"
 
-    def test_login_missing_password(self):
+    def test_login_missing_password(self, client):
         """
         Test login without password field.
 
@@ -569,14 +387,357 @@ class TestAuthenticationAPI(unittest.TestCase):
         """
         login_data = {"username": "testuser"}
 
-        response = self.client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json"
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         data = json.loads(response.data)
 
-        self.assertEqual(response.status_code, 400)
-        self.assertFalse(data["success"])
-        self.assertEqual(data["message"], "Username and password are required")
+        assert response.status_code == 400
+        assert not data["success"]
+        assert data["message"] == "Username and password are required"
+
+    def test_register_uses_configured_bcrypt_rounds(self):
+        """
+        Test that BCRYPT_ROUNDS config controls the stored hash cost factor.
+
+        Reference: #test_register_uses_configured_bcrypt_rounds - Configurable hashing cost
+        """
+        fast_app = create_app({"TESTING": True, "DATABASE_URL": "sqlite://", "BCRYPT_ROUNDS": 4})
+        user_data = {"username": "fasthash", "email": "fasthash@example.com", "password": "SecurePass123!"}
+
+        response = fast_app.test_client().post("/api/auth/register", json=user_data)
+
+        assert response.status_code == 201
+
+        session = fast_app.extensions["db_manager"].get_session()
+        db_user = session.scalar(select(User).where(User.username == "fasthash"))
+
+        assert db_user.password_hash.startswith("$2b$04$")
+        assert db_user.check_password("SecurePass123!")
+
+        session.close()
+        fast_app.extensions["db_manager"].engine.dispose()
+
+    def test_login_repeated_failure_skips_bcrypt(self, client, registered_user):
+        """
+        Test that a replayed bad password is rejected without re-running bcrypt.
+
+        Reference: #test_login_repeated_failure_skips_bcrypt - Failed login cache
+        """
+        login_data = {"username": registered_user["username"], "password": "WrongPassword123!"}
+
+        with patch.object(User, "check_password", autospec=True, return_value=False) as mock_check:
+            first = client.post("/api/auth/login", json=login_data)
+            second = client.post("/api/auth/login", json=login_data)
+
+        assert first.status_code == 401
+        assert second.status_code == 401
+        assert json.loads(second.data)["message"] == "Invalid credentials"
+        assert mock_check.call_count == 1
+
+    def test_register_clears_failed_logins_for_new_user(self, client):
+        """
+        Test that failures against a not-yet-registered username don't block the new account.
+
+        Reference: #test_register_clears_failed_logins_for_new_user - Cache invalidation
+        """
+        login_data = {"username": "latecomer", "password": "SecurePass123!"}
+        response = client.post("/api/auth/login", json=login_data)
+        assert response.status_code == 401
+
+        user_data = {"username": "latecomer", "email": "latecomer@example.com", "password": "SecurePass123!"}
+        client.post("/api/auth/register", json=user_data)
+
+        response = client.post("/api/auth/login", json=login_data)
+        assert response.status_code == 200
+
+    def test_register_no_select_after_insert(self, client, db_manager):
+        """
+        Test that registration builds its response without re-reading the new row.
+
+        Reference: #test_register_no_select_after_insert - No post-commit refresh round trip
+        """
+        from sqlalchemy import event
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+        engine = db_manager.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            user_data = {"username": "noselect", "email": "noselect@example.com", "password": "SecurePass123!"}
+            response = client.post("/api/auth/register", json=user_data)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 201
+        assert json.loads(response.data)["user"]["id"] is not None
+        assert "INSERT" in statements
+        assert "SELECT" not in statements[statements.index("INSERT"):]
+
+    def test_scoped_session_removed_after_request(self, client, db_manager):
+        """
+        Test that the request-scoped session is released when the app context tears down.
+
+        Reference: #test_scoped_session_removed_after_request - Session lifecycle
+        """
+        login_data = {"username": "nobody", "password": "SecurePass123!"}
+        client.post("/api/auth/login", json=login_data)
+
+        assert not db_manager.Session.registry.has()
+
+    def test_json_response_without_orjson(self, client):
+        """
+        Test that responses fall back to Flask's jsonify when orjson is unavailable.
+
+        Reference: #test_json_response_without_orjson - Optional orjson dependency
+        """
+        with patch("src.api.auth_routes.ORJSON_AVAILABLE", False):
+            user_data = {"username": "nofastjson", "email": "nofastjson@example.com", "password": "SecurePass123!"}
+            response = client.post("/api/auth/register", json=user_data)
+
+        assert response.status_code == 201
+        assert response.content_type == "application/json"
+        assert json.loads(response.data)["user"]["username"] == "nofastjson"
+
+    def test_sqlite_connections_use_wal(self, tmp_path):
+        """
+        Test that SQLite connections are opened in WAL mode with relaxed sync.
+
+        Reference: #test_sqlite_connections_use_wal - SQLite pragma tuning
+        """
+        from sqlalchemy import text
+
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'auth_test.db'}")
+
+        with db_manager.engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # synchronous=NORMAL is reported as 1
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+
+        db_manager.engine.dispose()
+
+    def test_static_error_responses_are_not_shared(self, app, client):
+        """
+        Test that pre-encoded error bodies produce independent response objects.
+
+        Mutating one error response (as an after_request hook might) must not
+        leak headers or cookies into later responses built from the same body.
+
+        Reference: #test_static_error_responses_are_not_shared - Canned error bodies
+        """
+        with app.test_request_context():
+            mutated, status = _error_response(_ERR_CREDENTIALS_REQUIRED, 400)
+            mutated.headers["X-Mutated"] = "1"
+            mutated.set_cookie("mutated", "1")
+            fresh, _ = _error_response(_ERR_CREDENTIALS_REQUIRED, 400)
+
+        assert status == 400
+        assert "X-Mutated" not in fresh.headers
+        assert "Set-Cookie" not in fresh.headers
+
+        response = client.post("/api/auth/login", json={"username": "someone"})
+
+        assert response.status_code == 400
+        assert response.content_type == "application/json"
+        assert response.data == _ERR_CREDENTIALS_REQUIRED
+        assert json.loads(response.data) == {"success": False, "message": "Username and password are required"}
+        assert "X-Mutated" not in response.headers
+        assert "Set-Cookie" not in response.headers
+
+    def test_registered_identities_loaded_at_startup(self, app, client):
+        """
+        Test that existing usernames/emails seed the registration Bloom filter.
+
+        Reference: #test_registered_identities_loaded_at_startup - Bloom filter warm-up
+        """
+        user_data = {"username": "bloomuser", "email": "bloomuser@example.com", "password": "SecurePass123!"}
+        client.post("/api/auth/register", json=user_data)
+
+        fresh_app = create_app({"TESTING": True, "DATABASE_URL": app.config["DATABASE_URL"], "BCRYPT_ROUNDS": 4})
+        registered_identities = fresh_app.extensions["registered_identities"]
+
+        assert "bloomuser" in registered_identities
+        assert "bloomuser@example.com" in registered_identities
+
+        # The duplicate is still reported with the specific message from a fresh app
+        response = fresh_app.test_client().post("/api/auth/register", json=user_data)
+        assert response.status_code == 409
+        assert json.loads(response.data)["message"] == "Username already exists"
+
+    def test_register_new_user_skips_duplicate_queries(self, app, client, db_manager):
+        """
+        Test that a never-seen username/email is registered without EXISTS probes.
+
+        Reference: #test_register_new_user_skips_duplicate_queries - Bloom filter fast path
+        """
+        from sqlalchemy import event
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+        engine = db_manager.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            user_data = {"username": "freshuser", "email": "freshuser@example.com", "password": "SecurePass123!"}
+            response = client.post("/api/auth/register", json=user_data)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 201
+        assert "SELECT" not in statements
+        assert "freshuser" in app.extensions["registered_identities"]
+
+    @pytest.mark.parametrize(
+        "duplicate_data, message",
+        [
+            ({"username": "otherworker", "email": "mine@example.com"}, "Username already exists"),
+            ({"username": "mine", "email": "otherworker@example.com"}, "Email already exists"),
+        ],
+    )
+    def test_register_duplicate_missed_by_bloom_filter(self, client, db_session, duplicate_data, message):
+        """
+        Test that a duplicate the Bloom filter hasn't seen still gets the specific 409 message.
+
+        Reference: #test_register_duplicate_missed_by_bloom_filter - IntegrityError fallback
+        """
+        # Inserted directly, as another worker process would, so this app's filter never saw it
+        db_session.add(User(username="otherworker", email="otherworker@example.com", password_hash="x"))
+        db_session.commit()
+
+        response = client.post("/api/auth/register", json={**duplicate_data, "password": "SecurePass123!"})
+
+        assert response.status_code == 409
+        assert json.loads(response.data) == {"success": False, "message": message}
+
+    def test_apps_keep_separate_database_managers(self, client, db_manager):
+        """
+        Test that two apps in one process do not share database state.
+
+        Reference: #test_apps_keep_separate_database_managers - Per-app db_manager
+        """
+        other_app = create_app(
+            {"TESTING": True, "DATABASE_URL": "sqlite://", "SECRET_KEY": "test-secret-key", "BCRYPT_ROUNDS": 4}
+        )
+        try:
+            assert db_manager is not other_app.extensions["db_manager"]
+
+            user_data = {"username": "firstapp", "email": "firstapp@example.com", "password": "SecurePass123!"}
+            response = client.post("/api/auth/register", json=user_data)
+            assert response.status_code == 201
+
+            # The user registered on the first app must not exist in the second app's database
+            login_data = {"username": "firstapp", "password": "SecurePass123!"}
+            response = other_app.test_client().post("/api/auth/login", json=login_data)
+            assert response.status_code == 401
+        finally:
+            other_app.extensions["db_manager"].engine.dispose()
+
+    def test_check_password_rejects_malformed_hash(self):
+        """
+        Test that empty or non-bcrypt stored hashes fail verification instead of raising.
+
+        Reference: #test_check_password_rejects_malformed_hash - Hash sanity check
+        """
+        for stored_hash in ("", "plaintext", "$2b$04$" + "x" * 10, "x" * 60):
+            user = User(username="broken", email="broken@example.com", password_hash=stored_hash)
+            with patch("src.api.models.verify_dummy_password", return_value=False) as mock_dummy:
+                assert not user.check_password("SecurePass123!")
+            mock_dummy.assert_called_once_with(DEFAULT_BCRYPT_ROUNDS)
+
+    def test_login_malformed_hash_uses_configured_rounds(self, client, db_session):
+        """
+        Test that a malformed stored hash is rejected at the app's bcrypt cost, like an unknown user.
+
+        Reference: #test_login_malformed_hash_uses_configured_rounds - Matching rejection cost
+        """
+        db_session.add(User(username="brokenhash", email="brokenhash@example.com", password_hash="plaintext"))
+        db_session.commit()
+
+        with patch("src.api.models.verify_dummy_password", return_value=False) as mock_dummy:
+            response = client.post("/api/auth/login", json={"username": "brokenhash", "password": "SecurePass123!"})
+
+        assert response.status_code == 401
+        mock_dummy.assert_called_once_with(4)
+
+    def test_login_unknown_user_runs_dummy_check(self, client):
+        """
+        Test that logins for unknown users still spend a bcrypt verification.
+
+        Reference: #test_login_unknown_user_runs_dummy_check - Timing-uniform rejection
+        """
+        login_data = {"username": "ghostuser", "password": "SecurePass123!"}
+
+        with patch("src.api.auth_routes.verify_dummy_password", return_value=False) as mock_dummy:
+            response = client.post("/api/auth/login", json=login_data)
+
+        assert response.status_code == 401
+        assert json.loads(response.data)["message"] == "Invalid credentials"
+        mock_dummy.assert_called_once()
+
+    def test_create_tables_skipped_on_warm_start(self, tmp_path):
+        """
+        Test that create_tables records a schema marker and skips create_all when it matches.
+
+        Reference: #test_create_tables_skipped_on_warm_start - Schema warm-start marker
+        """
+        from src.api.models import Base
+
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'auth_test.db'}")
+        db_manager.create_tables()
+        try:
+            with db_manager.engine.connect() as connection:
+                assert connection.exec_driver_sql("PRAGMA user_version").scalar() != 0
+
+            with patch.object(Base.metadata, "create_all") as mock_create_all:
+                db_manager.create_tables()
+            mock_create_all.assert_not_called()
+
+            # Dropping the schema clears the marker so the next call rebuilds the tables
+            db_manager.drop_tables()
+            with db_manager.engine.connect() as connection:
+                assert connection.exec_driver_sql("PRAGMA user_version").scalar() == 0
+
+            db_manager.create_tables()
+            session = db_manager.get_session()
+            assert session.scalar(select(func.count()).select_from(User)) == 0
+            session.close()
+        finally:
+            db_manager.engine.dispose()
+
+    def test_in_memory_database_shared_across_sessions(self):
+        """
+        Test that an in-memory SQLite manager keeps one database for all of its sessions.
+
+        Reference: #test_in_memory_database_shared_across_sessions - StaticPool for :memory:
+        """
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        try:
+            db_manager.create_tables()
+            with db_manager.get_session() as session:
+                session.add(User(username="memuser", email="memuser@example.com", password_hash="x"))
+                session.commit()
+
+            with db_manager.get_session() as session:
+                assert session.scalar(select(User.id).where(User.username == "memuser")) is not None
+        finally:
+            db_manager.engine.dispose()
+
+    def test_register_and_login_timestamps_match(self, client):
+        """
+        Test that register and login serialize the same naive-UTC timestamps.
+
+        Reference: #test_register_and_login_timestamps_match - Consistent timestamp format
+        """
+        user_data = {"username": "tsuser", "email": "tsuser@example.com", "password": "SecurePass123!"}
+        registered = json.loads(client.post("/api/auth/register", json=user_data).data)["user"]
+        logged_in = json.loads(
+            client.post("/api/auth/login", json={"username": "tsuser", "password": "SecurePass123!"}).data
+        )["user"]
+
+        for field in ("created_at", "updated_at"):
+            assert registered[field] == logged_in[field]
+            assert datetime.fromisoformat(registered[field]).tzinfo is None
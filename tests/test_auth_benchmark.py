@@ -0,0 +1,48 @@
+"""
+Benchmarks for the authentication API hot path.
+
+Measures registration latency on the shared test app (bcrypt cost 4,
+in-memory SQLite) and fails if the mean exceeds REGISTER_MEAN_CEILING_S. The
+ceiling is an absolute bound sized for slow CI runners, so it catches
+order-of-magnitude regressions (bcrypt cost creeping back up, a file-backed
+database, per-request engine setup) rather than small drifts. Skipped when
+pytest-benchmark is not installed; the check is skipped when benchmarking is
+disabled (e.g. --benchmark-disable or under pytest-xdist).
+
+To compare locally before and after a change:
+    pytest tests/test_auth_benchmark.py --benchmark-autosave
+    pytest tests/test_auth_benchmark.py --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Reference: test_auth_benchmark.py - Register endpoint microbenchmark
+"""
+
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# About 10x the mean measured locally (~2.5 ms); one cost-12 bcrypt hash alone takes ~300 ms
+REGISTER_MEAN_CEILING_S = 0.025
+
+_user_ids = itertools.count()
+
+
+def _unique_user() -> dict:
+    """Registration payload with a never-used username/email, so no request hits a 409."""
+    user_id = next(_user_ids)
+    return {"username": f"bench{user_id}", "email": f"bench{user_id}@example.com", "password": "SecurePass123!"}
+
+
+@pytest.mark.benchmark(group="auth", max_time=0.1, min_rounds=20)
+def test_register_benchmark(benchmark, client):
+    """
+    Benchmark POST /api/auth/register with a fresh user per round.
+
+    Reference: #test_register_benchmark - Registration latency guard
+    """
+    response = benchmark(lambda: client.post("/api/auth/register", json=_unique_user()))
+
+    assert response.status_code == 201
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean < REGISTER_MEAN_CEILING_S
@@ -0,0 +1,47 @@
+"""
+Unit Tests for Bloom Filter
+
+Tests membership guarantees, false-positive rate and parameter validation
+for the Bloom filter used by the registration endpoint.
+
+Reference: test_bloom_filter.py - BloomFilter tests
+"""
+
+import pytest
+
+from src.api.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    """Test suite for BloomFilter."""
+
+    def test_added_items_are_members(self):
+        """Test that there are no false negatives."""
+        bloom = BloomFilter(capacity=1000)
+        items = [f"user{i}@example.com" for i in range(1000)]
+        bloom.update(items)
+
+        assert all(item in bloom for item in items)
+        assert len(bloom) == 1000
+
+    def test_empty_filter_has_no_members(self):
+        """Test that an empty filter reports every item as absent."""
+        bloom = BloomFilter(capacity=10)
+
+        assert "alice" not in bloom
+        assert "" not in bloom
+
+    def test_false_positive_rate_near_target(self):
+        """Test that the false-positive rate stays near the configured target at capacity."""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        bloom.update(f"present{i}" for i in range(5000))
+
+        false_positives = sum(f"absent{i}" in bloom for i in range(20000))
+
+        assert false_positives / 20000 < 0.03
+
+    @pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 0.0), (10, 1.0)])
+    def test_invalid_parameters(self, capacity, error_rate):
+        """Test that invalid sizing parameters are rejected."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
@@ -1,7 +1,10 @@
+import csv
+import io
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pandas as pd
+import pytest
 
 from scripts.clean_csv import clean_csv
 
@@ -15,33 +18,67 @@ another/path,docx,Contribute,Jane Doe,jane@example.com,Internal,,,
 
 
 def test_clean_csv_basic():
+    out = io.StringIO()
+
+    stats = clean_csv(io.StringIO(SAMPLE), out)
+    assert stats["comment_lines"] == 1
+    assert stats["blank_lines"] == 1
+    assert stats["skipped_repeated_headers"] == 1
+    assert stats["output_rows"] == 2
+
+    df = pd.read_csv(io.StringIO(out.getvalue()))
+    assert list(df.columns) == [
+        "Resource Path",
+        "Item Type",
+        "Permission",
+        "User Name",
+        "User Email",
+        "User Or Group Type",
+        "Link ID",
+        "Link Type",
+        "AccessViaLinkID",
+    ]
+    assert df.shape == (2, 9)
+    # Quoted comma should be preserved as a single field
+    assert df.iloc[0]["Resource Path"] == "parent/path,with,comma"
+
+
+CLEANING_CASES = [
+    pytest.param("# exported by tool\na,b\n1,2\n", {"comment_lines": 1}, [["1", "2"]], id="comment"),
+    pytest.param("a,b\n\n1,2\n   \n", {"blank_lines": 2}, [["1", "2"]], id="blank"),
+    pytest.param(
+        "a,b\n1,2\na,b\n3,4\n", {"skipped_repeated_headers": 1}, [["1", "2"], ["3", "4"]], id="repeated_header"
+    ),
+    pytest.param('a,b\n"x,y",2\n', {"output_rows": 1}, [["x,y", "2"]], id="quoted_comma"),
+    pytest.param("a,b\r\n1,2\r\n", {"output_rows": 1}, [["1", "2"]], id="crlf"),
+    pytest.param("a , b\n 1 ,2 \n", {"header": ["a", "b"]}, [["1", "2"]], id="cell_whitespace"),
+]
+
+
+@pytest.mark.parametrize("csv_text,expected_stats,expected_rows", CLEANING_CASES)
+def test_clean_csv_cases(csv_text, expected_stats, expected_rows):
+    out = io.StringIO()
+
+    stats = clean_csv(io.StringIO(csv_text), out)
+
+    for key, value in expected_stats.items():
+        assert stats[key] == value
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[1:] == expected_rows
+
+
+def test_clean_csv_path_and_buffer_match():
     with TemporaryDirectory() as td:
         td = Path(td)
         inp = td / "in.csv"
-        out = td / "out.csv"
+        out = td / "nested" / "out.csv"
         inp.write_text(SAMPLE, encoding="utf-8")
+        buffer_out = io.StringIO()
 
-        stats = clean_csv(inp, out)
-        assert stats["comment_lines"] == 1
-        assert stats["blank_lines"] == 1
-        assert stats["skipped_repeated_headers"] == 1
-        assert stats["output_rows"] == 2
-
-        df = pd.read_csv(out)
-        assert list(df.columns) == [
-            "Resource Path",
-            "Item Type",
-            "Permission",
-            "User Name",
-            "User Email",
-            "User Or Group Type",
-            "Link ID",
-            "Link Type",
-            "AccessViaLinkID",
-        ]
-        assert df.shape == (2, 9)
-        # Quoted comma should be preserved as a single field
-        assert df.iloc[0]["Resource Path"] == "parent/path,with,comma"
+        assert clean_csv(inp, out) == clean_csv(io.StringIO(SAMPLE), buffer_out)
+        assert out.read_text(encoding="utf-8") == buffer_out.getvalue()
+        # Caller-owned streams are left open
+        assert not buffer_out.closed
 
 
 def test_clean_csv_empty_file():
@@ -2,9 +2,11 @@
 Tests for the GPT-5 Cost Tracker.
 """
 
+import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 
@@ -86,6 +88,52 @@ class TestGPT5CostTracker:
             tracker2.track_request("gpt-5-nano", 2000, 1000)
             assert len(tracker2.history) == 2
 
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_history_round_trip_with_and_without_orjson(self, orjson_available):
+        """Test that the log stays a plain JSON array whichever encoder wrote it."""
+        if orjson_available and not cost_tracker.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        with TemporaryDirectory() as td, patch.object(cost_tracker, "ORJSON_AVAILABLE", orjson_available):
+            log_file = Path(td) / "history.json"
+            tracker = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+            tracker.track_request("gpt-5", 1000, 500, metadata={"task": "café", 1: "int key"})
+
+            saved = json.loads(log_file.read_text(encoding="utf-8"))
+            assert saved[0]["metadata"] == {"task": "café", "1": "int key"}
+            assert GPT5CostTracker(log_file=str(log_file)).history == saved
+
+    def test_saves_append_to_existing_log(self):
+        """Test that later saves append to the JSON array instead of rewriting the file."""
+        with TemporaryDirectory() as td:
+            log_file = Path(td) / "history.json"
+            tracker = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+
+            with patch.object(Path, "write_bytes", autospec=True, side_effect=Path.write_bytes) as full_write:
+                for _ in range(5):
+                    tracker.track_request("gpt-5-mini", 1000, 500)
+
+            assert full_write.call_count == 1
+            content = log_file.read_text(encoding="utf-8")
+            assert json.loads(content) == tracker.history
+            assert "\n" not in content  # Compact, machine-read format
+
+            # A reloaded tracker keeps appending to the same array
+            reloaded = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+            reloaded.track_request("gpt-5-nano", 10, 5)
+            assert len(json.loads(log_file.read_text(encoding="utf-8"))) == 6
+
+    def test_save_rewrites_log_that_cannot_be_appended(self):
+        """Test that an externally truncated log is rewritten in full on the next save."""
+        with TemporaryDirectory() as td:
+            log_file = Path(td) / "history.json"
+            tracker = GPT5CostTracker(log_file=str(log_file), auto_save=True)
+            tracker.track_request("gpt-5", 100, 50)
+
+            log_file.write_text("[", encoding="utf-8")
+            tracker.track_request("gpt-5", 100, 50)
+
+            assert json.loads(log_file.read_text(encoding="utf-8")) == tracker.history
+
     def test_get_periodic_costs(self):
         """Test daily, weekly, and monthly cost calculations."""
         with TemporaryDirectory() as td:
@@ -123,6 +171,20 @@ class TestGPT5CostTracker:
 
             assert tracker.get_monthly_cost() == pytest.approx(monthly_cost)
 
+    def test_period_costs_use_epoch_and_legacy_timestamps(self):
+        """Test that entries with and without the numeric epoch field are filtered alike."""
+        with TemporaryDirectory() as td:
+            tracker = GPT5CostTracker(log_file=str(Path(td) / "log.json"))
+            tracker.track_request("gpt-5", 1_000_000, 0)  # $4.00, written with "epoch"
+            assert "epoch" in tracker.history[-1]
+
+            now = datetime.now()
+            tracker.history.append({"timestamp": now.isoformat(), "cost": {"total": 1.0}})
+            tracker.history.append({"timestamp": (now - timedelta(days=10)).isoformat(), "cost": {"total": 2.0}})
+
+            assert tracker.get_daily_cost() == pytest.approx(5.0)
+            assert tracker.get_weekly_cost() == pytest.approx(5.0)
+
     def test_get_cost_by_model_and_type(self):
         """Test cost aggregation by model and request type."""
         tracker = GPT5CostTracker()
@@ -261,6 +261,10 @@ class TestCisAuditColumns:
         """Test that expected number of columns is defined."""
         assert len(CIS_AUDIT_COLUMNS) == 9
 
+    def test_columns_are_immutable(self):
+        """Test that the shared column order cannot be mutated by callers."""
+        assert isinstance(CIS_AUDIT_COLUMNS, tuple)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
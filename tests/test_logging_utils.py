@@ -0,0 +1,68 @@
+"""
+Tests for the shared queue-based logging setup.
+"""
+
+import atexit
+import logging
+import logging.handlers
+from unittest.mock import patch
+
+import pytest
+
+from src.core import logging_utils
+from src.core.logging_utils import configure_queue_logging
+
+
+@pytest.fixture
+def service_logger():
+    """Private logger standing in for the root logger; stops any listener started for it."""
+    logger = logging.Logger("service")
+    with patch.object(logging_utils, "_log_listener", None):
+        yield logger
+        listener = logging_utils._log_listener
+        if listener is not None:
+            listener.stop()
+            atexit.unregister(listener.stop)
+            for handler in listener.handlers:
+                handler.close()
+
+
+def test_configure_queue_logging_writes_unbuffered(service_logger, tmp_path):
+    """Test that INFO records reach the rotating log file without waiting for a flush trigger."""
+    log_file = tmp_path / "logs" / "service.log"
+
+    listener = configure_queue_logging(log_file, max_bytes=1_000, backup_count=2, logger=service_logger)
+
+    file_handler = next(h for h in listener.handlers if isinstance(h, logging.handlers.RotatingFileHandler))
+    assert file_handler.maxBytes == 1_000
+    assert file_handler.backupCount == 2
+    assert not any(isinstance(h, logging.handlers.MemoryHandler) for h in listener.handlers)
+
+    service_logger.info("first record")
+    # stop() drains the queue; restart so the fixture can stop it again
+    listener.stop()
+    listener.start()
+
+    assert " - service - INFO - first record" in log_file.read_text(encoding="utf-8")
+
+
+def test_configure_queue_logging_is_idempotent(service_logger, tmp_path):
+    """Test that repeated calls don't stack duplicate handlers or listeners."""
+    first = configure_queue_logging(tmp_path / "service.log", logger=service_logger)
+    second = configure_queue_logging(tmp_path / "service.log", logger=service_logger)
+
+    assert first is not None
+    assert second is None
+    assert len(service_logger.handlers) == 1
+    assert isinstance(service_logger.handlers[0], logging.handlers.QueueHandler)
+    assert service_logger.level == logging.INFO
+
+
+def test_configure_queue_logging_respects_existing_handlers(service_logger, tmp_path):
+    """Test that an application's own logging configuration is left alone."""
+    existing = logging.NullHandler()
+    service_logger.addHandler(existing)
+
+    assert configure_queue_logging(tmp_path / "service.log", logger=service_logger) is None
+    assert service_logger.handlers == [existing]
+    assert not (tmp_path / "service.log").exists()
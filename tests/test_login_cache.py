@@ -0,0 +1,67 @@
+"""
+Unit Tests for Failed Login Cache
+
+Tests TTL expiry, size bounds and identifier invalidation for the
+negative-lookup cache used by the login endpoint.
+
+Reference: test_login_cache.py - FailedLoginCache tests
+"""
+
+from unittest.mock import patch
+
+from src.api.login_cache import FailedLoginCache
+
+
+class TestFailedLoginCache:
+    """Test suite for FailedLoginCache."""
+
+    def test_add_and_contains(self):
+        """Test that a recorded failure is found for the same pair only."""
+        cache = FailedLoginCache()
+        cache.add("alice", "wrong")
+
+        assert cache.contains("alice", "wrong")
+        assert not cache.contains("alice", "other")
+        assert not cache.contains("bob", "wrong")
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after the TTL."""
+        cache = FailedLoginCache(ttl=60.0)
+        with patch("src.api.login_cache.time.monotonic", return_value=1000.0):
+            cache.add("alice", "wrong")
+        with patch("src.api.login_cache.time.monotonic", return_value=1059.0):
+            assert cache.contains("alice", "wrong")
+        with patch("src.api.login_cache.time.monotonic", return_value=1060.0):
+            assert not cache.contains("alice", "wrong")
+        assert len(cache) == 0
+
+    def test_maxsize_evicts_oldest(self):
+        """Test that the cache stays bounded and evicts the oldest entry."""
+        cache = FailedLoginCache(maxsize=2)
+        cache.add("a", "pw")
+        cache.add("b", "pw")
+        cache.add("c", "pw")
+
+        assert len(cache) == 2
+        assert not cache.contains("a", "pw")
+        assert cache.contains("c", "pw")
+
+    def test_discard_identifiers(self):
+        """Test that all failures for an identifier can be forgotten."""
+        cache = FailedLoginCache()
+        cache.add("alice", "one")
+        cache.add("alice", "two")
+        cache.add("bob", "one")
+
+        cache.discard_identifiers(["alice"])
+
+        assert not cache.contains("alice", "one")
+        assert not cache.contains("alice", "two")
+        assert cache.contains("bob", "one")
+
+    def test_password_not_stored(self):
+        """Test that plain text passwords are not kept in the cache."""
+        cache = FailedLoginCache()
+        cache.add("alice", "SuperSecret!")
+
+        assert all("SuperSecret!" not in key for key in cache._entries)
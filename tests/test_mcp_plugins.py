@@ -8,6 +8,8 @@ These tests verify:
 """
 
 import json
+import logging
+import logging.handlers
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
@@ -249,6 +251,30 @@ class TestM365MCPServerPluginLoading:
             assert "Invalid entry_point format" in str(exc_info.value)
 
 
+class TestM365MCPServerLogging:
+    """Tests for MCP server logging setup."""
+
+    @pytest.mark.parametrize(
+        "module_name,server_class_name",
+        [("src.mcp.m365_mcp_server", "M365MCPServer"), ("src.extensions.mcp.server", "M365SecurityMCPServer")],
+    )
+    def test_setup_logging_uses_shared_queue_logging(self, module_name, server_class_name, tmp_path):
+        """Test that both MCP servers route logging through the shared helper and the same log file."""
+        import importlib
+
+        module = importlib.import_module(module_name)
+        server_class = getattr(module, server_class_name)
+
+        with patch.object(server_class, "__init__", lambda self: None), patch(
+            f"{module_name}.Path.home", return_value=tmp_path
+        ), patch(f"{module_name}.configure_queue_logging") as mock_configure:
+            server = server_class()
+            server.setup_logging()
+
+        mock_configure.assert_called_once_with(tmp_path / ".aitk" / "logs" / "m365_mcp_server.log")
+        assert server.logger.name == module_name
+
+
 class TestM365MCPServerIntegration:
     """Integration tests for the M365 MCP Server."""
 
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.integrations.openai_gpt5 import GPT5Client, analyze_with_reasoning, quick_chat
+from src.integrations.openai_gpt5 import GPT5Client, _default_credential, analyze_with_reasoning, quick_chat
 
 
 @pytest.fixture
@@ -25,7 +25,9 @@ def mock_azure_credential():
     with patch("src.integrations.openai_gpt5.DefaultAzureCredential") as mock_cred, patch(
         "src.integrations.openai_gpt5.get_bearer_token_provider"
     ) as mock_token:
+        _default_credential.cache_clear()
         yield mock_cred, mock_token
+    _default_credential.cache_clear()
 
 
 class TestGPT5Client:
@@ -42,6 +44,27 @@ class TestGPT5Client:
         mock_azure_credential[1].assert_called_once()  # get_bearer_token_provider called
         mock_openai_client.assert_called_once()
 
+    def test_init_entra_id_narrows_default_credential(self, mock_env, mock_openai_client, mock_azure_credential):
+        GPT5Client(use_entra_id=True)
+        kwargs = mock_azure_credential[0].call_args[1]
+        assert kwargs["exclude_shared_token_cache_credential"] is True
+        assert kwargs["exclude_visual_studio_code_credential"] is True
+        assert kwargs["exclude_powershell_credential"] is True
+        assert "exclude_cli_credential" not in kwargs
+
+    def test_init_entra_id_custom_credential(self, mock_env, mock_openai_client, mock_azure_credential):
+        credential = MagicMock()
+        GPT5Client(use_entra_id=True, credential=credential)
+        mock_azure_credential[0].assert_not_called()
+        assert mock_azure_credential[1].call_args[0][0] is credential
+
+    def test_init_entra_id_shares_default_credential(self, mock_env, mock_openai_client, mock_azure_credential):
+        GPT5Client(use_entra_id=True)
+        GPT5Client(use_entra_id=True, model="gpt-5-mini")
+        mock_azure_credential[0].assert_called_once()
+        first, second = (call[0][0] for call in mock_azure_credential[1].call_args_list)
+        assert first is second
+
     def test_init_missing_endpoint(self):
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ValueError, match="Azure OpenAI endpoint is required"):
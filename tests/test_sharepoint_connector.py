@@ -6,7 +6,13 @@ import pandas as pd
 import pytest
 
 from src.core.excel_generator import create_project_management_workbook
-from src.integrations.sharepoint_connector import build_summaries, main, write_excel_report
+from src.integrations.sharepoint_connector import (
+    STRING_DTYPE,
+    build_summaries,
+    main,
+    read_permissions_csv,
+    write_excel_report,
+)
 
 
 @pytest.fixture
@@ -95,6 +101,34 @@ class TestBuildSummaries:
         assert "123" in permissions["Permission"].values
         assert "Read" in permissions["Permission"].values
 
+    @pytest.mark.parametrize("string_dtype", ["string", "string[pyarrow]"])
+    def test_build_summaries_missing_values_not_counted_as_text(self, monkeypatch, string_dtype):
+        """Test that missing cells stay missing (not a "nan" group) with either string backend."""
+        if string_dtype == "string[pyarrow]":
+            pytest.importorskip("pyarrow")
+        monkeypatch.setattr("src.integrations.sharepoint_connector.STRING_DTYPE", string_dtype)
+        data = {
+            "Resource Path": ["/sites/SiteA/doc1", None],
+            "Permission": ["Read", None],
+            "User Name": ["User1", None],
+            "User Email": ["user1@test.com", None],
+        }
+        summaries = build_summaries(pd.DataFrame(data))
+
+        assert summaries["by_permission"]["Permission"].tolist() == ["Read"]
+        assert summaries["top_users"]["User Email"].tolist() == ["user1@test.com"]
+        assert summaries["top_resources"]["Resource Path"].tolist() == ["/sites/SiteA/doc1"]
+
+    def test_build_summaries_do_not_return_categoricals(self, sample_dataframe):
+        """Test that categorical counting doesn't leak the category dtype into the summaries."""
+        summaries = build_summaries(sample_dataframe)
+
+        for summary in summaries.values():
+            for column_name in summary.columns.drop("Count"):
+                assert summary[column_name].dtype == STRING_DTYPE
+        assert summaries["by_item_type"]["Item Type"].tolist() == ["File", "Folder"]
+        assert summaries["by_item_type"]["Count"].tolist() == [3, 1]
+
 
 class TestWriteExcelReport:
     """Tests for the write_excel_report function."""
@@ -140,6 +174,18 @@ class TestWriteExcelReport:
             assert len(overview_df) == len(summaries)
             assert "by_item_type" in overview_df["Summary"].values
 
+    def test_write_excel_report_missing_values_and_header_style(self):
+        """Test that missing values are written as empty cells under bold headers."""
+        summaries = {"custom": pd.DataFrame({"Name": ["a", None], "Count": [1, 2]}).astype({"Name": "string"})}
+        with TemporaryDirectory() as td:
+            output_path = Path(td) / "report.xlsx"
+            write_excel_report(summaries, output_path)
+
+            sheet = openpyxl.load_workbook(output_path)["custom"]
+            assert [cell.value for cell in sheet[1]] == ["Name", "Count"]
+            assert sheet["A1"].font.bold
+            assert [cell.value for cell in sheet[3]] == [None, 2]
+
 
 class TestMainFunction:
     """Tests for the main function."""
@@ -159,6 +205,24 @@ class TestMainFunction:
             main()
             assert output_file.exists()
 
+    @pytest.mark.parametrize("pyarrow_available", [True, False])
+    def test_read_permissions_csv_matches_default_parser(self, monkeypatch, sample_dataframe, pyarrow_available):
+        """Test that the CSV loads to the same summaries with or without the pyarrow engine."""
+        if pyarrow_available:
+            pytest.importorskip("pyarrow")
+        monkeypatch.setattr("src.integrations.sharepoint_connector.PYARROW_AVAILABLE", pyarrow_available)
+        with TemporaryDirectory() as td:
+            input_file = Path(td) / "input.csv"
+            sample_dataframe.to_csv(input_file, index=False)
+
+            loaded = read_permissions_csv(input_file)
+
+        assert list(loaded.columns) == list(sample_dataframe.columns)
+        assert len(loaded) == len(sample_dataframe)
+        expected = build_summaries(sample_dataframe)
+        for name, summary in build_summaries(loaded).items():
+            assert summary["Count"].tolist() == expected[name]["Count"].tolist()
+
     def test_create_project_management_workbook(self):
         """Test that the create_project_management_workbook function runs without error."""
         with TemporaryDirectory() as td:
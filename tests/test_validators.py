@@ -154,6 +154,22 @@ class TestValidators(unittest.TestCase):
         self.assertFalse(valid)
         self.assertIn("special character", error)
 
+    def test_validate_password_character_classes(self):
+        """Test character-class rules: ASCII letters only, Unicode decimal digits count."""
+        # Non-ASCII letters do not satisfy the uppercase/lowercase rules
+        valid, error = validate_password("ÉÉÉÉabc1!")
+        self.assertFalse(valid)
+        self.assertIn("uppercase", error)
+
+        # Unicode decimal digits satisfy the digit rule (same as regex \d)
+        valid, error = validate_password("Abcdefg!\u0663")
+        self.assertTrue(valid)
+        self.assertIsNone(error)
+
+        # Missing classes are reported in a fixed order
+        valid, error = validate_password("!!!!!!!!")
+        self.assertIn("uppercase", error)
+
     def test_validate_password_too_long(self):
         """Test password maximum length."""
         long_password = "A1!" + "a" * 130